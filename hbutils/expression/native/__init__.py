@@ -1,3 +1,6 @@
 from .base import *
 from .feature import *
 from .general import *
+from .vector import *
+from .linear import *
+from .compiled import *
@@ -1,4 +1,5 @@
-from functools import lru_cache
+import operator
+import weakref
 from typing import Callable
 
 __all__ = [
@@ -7,13 +8,104 @@ __all__ = [
 ]
 
 
-@lru_cache()
-def _raw_expr_func():
-    return getattr(Expression, '_expr')
+def _raw_expr(e) -> 'Expression':
+    if isinstance(e, Expression):
+        return e
+    return _EXPRESSION_EXPR(e)
 
 
-def _raw_expr(e) -> 'Expression':
-    return _raw_expr_func()(e)
+# functions without side effects, which can be pre-calculated when all the arguments are constant
+_PURE_FUNCS = {
+    operator.eq, operator.ne, operator.le, operator.lt, operator.ge, operator.gt,
+    operator.add, operator.sub, operator.mul, operator.truediv, operator.floordiv,
+    operator.mod, operator.pow, operator.pos, operator.neg, operator.not_,
+    operator.and_, operator.or_, operator.xor, operator.invert, operator.lshift, operator.rshift,
+    operator.getitem,
+}
+# immutable types of the constants which can be pre-calculated
+_CONST_TYPES = {int, float, complex, bool, str, bytes, type(None)}
+
+
+def _pure(func: Callable) -> Callable:
+    """
+    Mark the given function as pure function, which can be pre-calculated in :meth:`Expression._func`.
+    """
+    _PURE_FUNCS.add(func)
+    return func
+
+
+# limits of the pre-calculated constants, the same as CPython's AST optimizer, so that the building of \
+# expressions like ``raw(2) ** 10 ** 10`` will not hang, and the huge results will not be kept
+_MAX_INT_SIZE = 128  # bits
+_MAX_STR_SIZE = 4096  # length of str and bytes
+
+
+def _safe_multiply(x, y) -> bool:
+    if isinstance(x, int) and isinstance(y, int):
+        return not x or not y or x.bit_length() + y.bit_length() <= _MAX_INT_SIZE
+    elif isinstance(x, int) and isinstance(y, (str, bytes)):
+        return len(y) * x <= _MAX_STR_SIZE
+    elif isinstance(x, (str, bytes)) and isinstance(y, int):
+        return len(x) * y <= _MAX_STR_SIZE
+    else:
+        return True
+
+
+def _safe_product(x, *args) -> bool:
+    for v in args:
+        if not _safe_multiply(x, v):
+            return False
+        try:
+            x = x * v
+        except Exception:
+            break  # the error will be raised again by the pre-calculation
+    return True
+
+
+def _safe_power(x, y) -> bool:
+    if isinstance(x, int) and isinstance(y, int) and x and y > 0:
+        return x.bit_length() * y <= _MAX_INT_SIZE
+    else:
+        return True
+
+
+def _safe_lshift(x, y) -> bool:
+    if isinstance(x, int) and isinstance(y, int) and x and y > 0:
+        return x.bit_length() + y <= _MAX_INT_SIZE
+    else:
+        return True
+
+
+def _safe_mod(x, y) -> bool:
+    # the size of formatted string (e.g. '%0100000000d' % 1) can not be known before formatting
+    return not isinstance(x, (str, bytes))
+
+
+# checks of the pure functions whose results may be too large to be pre-calculated
+_FOLD_CHECKS = {
+    operator.mul: _safe_multiply,
+    operator.pow: _safe_power,
+    operator.lshift: _safe_lshift,
+    operator.mod: _safe_mod,
+}
+
+
+def _is_const(e: 'Expression') -> bool:
+    const = getattr(e, '_const')
+    return const is not None and type(const[0]) in _CONST_TYPES
+
+
+# structurally identical nodes of pure functions are shared, so they can be evaluated only once
+_INTERN_CACHE = weakref.WeakValueDictionary()
+
+
+def _intern_key(e: 'Expression'):
+    if _is_const(e):
+        value = getattr(e, '_const')[0]
+        # 0.0 == -0.0 but they are not the same constant
+        return type(value), (repr(value) if isinstance(value, (float, complex)) else value)
+    else:
+        return id(e)
 
 
 def efunc(e) -> Callable:
@@ -53,6 +145,7 @@ class Expression:
     Overview:
         Base class of expressions.
     """
+    __slots__ = ('_fcall', '_op', '_args', '_kwargs', '_const', '__weakref__')
 
     def __init__(self, func=None):
         """
@@ -61,6 +154,10 @@ class Expression:
         :param func: Callable function, default is ``None`` which means a ``lambda x: x`` will be used.
         """
         self._fcall = func or (lambda x: x)
+        self._op = None
+        self._args = ()
+        self._kwargs = {}
+        self._const = None  # tuple of value when this is a constant expression
 
     def _func(self, func: Callable, *args, **kwargs):
         """
@@ -85,16 +182,50 @@ class Expression:
             >>> efunc(e1.add(e1.add(1)))(5)  # 5 + (5 + 1) = 11
             11
         """
-        _args = tuple(efunc(v) for v in args)
-        _kwargs = {k: efunc(v) for k, v in kwargs.items()}
+        _args = tuple(_raw_expr(v) for v in args)
+        _kwargs = {k: _raw_expr(v) for k, v in kwargs.items()}
+        if func not in _PURE_FUNCS or _kwargs:
+            return self._build(func, _args, _kwargs)
+
+        if all(_is_const(v) for v in _args):
+            values = tuple(getattr(v, '_const')[0] for v in _args)
+            _check = _FOLD_CHECKS.get(func, None)
+            if _check is None or _check(*values):
+                try:
+                    value = func(*values)
+                except Exception:
+                    pass  # leave the error to the evaluation
+                else:
+                    return self._raw(value)
+
+        key = (self.__class__, func, *map(_intern_key, _args))
+        e = _INTERN_CACHE.get(key, None)
+        if e is None:
+            e = self._build(func, _args, _kwargs)
+            _INTERN_CACHE[key] = e
+        return e
+
+    def _build(self, func: Callable, args: tuple, kwargs: dict):
+        """
+        Build new node with given ``func`` and the expressions of arguments.
+
+        :param func: Logical function.
+        :param args: Positional arguments, should be expressions.
+        :param kwargs: Key-word arguments, should be expressions.
+        :return: New expression with current class.
+        """
+        _fargs = tuple(getattr(v, '_fcall') for v in args)
+        _fkwargs = {k: getattr(v, '_fcall') for k, v in kwargs.items()}
 
         def _new_func(x):
             return func(
-                *(v(x) for v in _args),
-                **{k: v(x) for k, v in _kwargs.items()},
+                *(v(x) for v in _fargs),
+                **{k: v(x) for k, v in _fkwargs.items()},
             )
 
-        return self.__class__(_new_func)
+        e = self.__class__(_new_func)
+        e._op, e._args, e._kwargs = func, args, kwargs
+        return e
 
     @classmethod
     def _expr(cls, v):
@@ -109,4 +240,24 @@ class Expression:
         elif callable(v):
             return cls(v)
         else:
-            return cls(lambda x: v)
+            return cls._raw(v)
+
+    @classmethod
+    def _raw(cls, v):
+        """
+        Build constant expression with this class.
+
+        :param v: Any types of value, even callable object.
+        :return: An expression object which always returns ``v``.
+
+        .. note::
+            The operations on constant expressions of immutable types (such as ``int`` and ``str``) \
+            will be pre-calculated when building the expression, e.g. ``raw(2) + 3`` will be built as ``raw(5)``.
+        """
+        e = cls(lambda x: v)
+        e._const = (v,)
+        return e
+
+
+# bound once, so the class attribute will not be looked up on every call
+_EXPRESSION_EXPR = getattr(Expression, '_expr')
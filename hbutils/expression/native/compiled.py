@@ -0,0 +1,155 @@
+"""
+Overview:
+    Compiled evaluation of native expressions, the whole expression tree is compiled to one python function.
+"""
+import ast
+import operator
+from typing import Callable
+
+from .base import _raw_expr, _is_const
+from .feature import _sum, _product, _and, _or
+
+__all__ = [
+    'cfunc',
+]
+
+_BINARY_OPS = {
+    operator.add: ast.Add,
+    operator.sub: ast.Sub,
+    operator.mul: ast.Mult,
+    operator.truediv: ast.Div,
+    operator.floordiv: ast.FloorDiv,
+    operator.mod: ast.Mod,
+    operator.pow: ast.Pow,
+    operator.and_: ast.BitAnd,
+    operator.or_: ast.BitOr,
+    operator.xor: ast.BitXor,
+    operator.lshift: ast.LShift,
+    operator.rshift: ast.RShift,
+}
+_VARIADIC_OPS = {
+    _sum: ast.Add,
+    _product: ast.Mult,
+}
+_COMPARE_OPS = {
+    operator.eq: ast.Eq,
+    operator.ne: ast.NotEq,
+    operator.le: ast.LtE,
+    operator.lt: ast.Lt,
+    operator.ge: ast.GtE,
+    operator.gt: ast.Gt,
+}
+_BOOL_OPS = {
+    _and: ast.And,
+    _or: ast.Or,
+}
+_UNARY_OPS = {
+    operator.pos: ast.UAdd,
+    operator.neg: ast.USub,
+    operator.invert: ast.Invert,
+    operator.not_: ast.Not,
+}
+
+
+def _load(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Load())
+
+
+class _Compiler:
+    def __init__(self, e):
+        self.root = e
+        self.globals = {}
+        self.counts = {}
+        self.names = {}
+        self._count(e)
+
+    def _count(self, node):
+        self.counts[id(node)] = self.counts.get(id(node), 0) + 1
+        if self.counts[id(node)] == 1:
+            for arg in (*getattr(node, '_args'), *getattr(node, '_kwargs').values()):
+                self._count(arg)
+
+    def _global(self, prefix: str, value) -> ast.Name:
+        name = f'_{prefix}{len(self.globals)}'
+        self.globals[name] = value
+        return _load(name)
+
+    def _node(self, node, cond: bool) -> ast.expr:
+        op, args, kwargs = getattr(node, '_op'), getattr(node, '_args'), getattr(node, '_kwargs')
+        if _is_const(node):
+            return ast.Constant(value=getattr(node, '_const')[0])
+        elif op is None:  # leaf nodes, call the function with input
+            return ast.Call(func=self._global('f', getattr(node, '_fcall')), args=[_load('x')], keywords=[])
+
+        if not kwargs:
+            if len(args) == 2 and op in _BINARY_OPS:
+                return ast.BinOp(left=self.visit(cond, args[0]), op=_BINARY_OPS[op](),
+                                 right=self.visit(cond, args[1]))
+            elif len(args) >= 2 and op in _VARIADIC_OPS:
+                result = self.visit(cond, args[0])
+                for arg in args[1:]:
+                    result = ast.BinOp(left=result, op=_VARIADIC_OPS[op](), right=self.visit(cond, arg))
+                return result
+            elif len(args) == 2 and op in _COMPARE_OPS:
+                return ast.Compare(left=self.visit(cond, args[0]), ops=[_COMPARE_OPS[op]()],
+                                   comparators=[self.visit(cond, args[1])])
+            elif len(args) == 2 and op in _BOOL_OPS:  # right operand is evaluated conditionally
+                return ast.BoolOp(op=_BOOL_OPS[op](),
+                                  values=[self.visit(cond, args[0]), self.visit(True, args[1])])
+            elif len(args) == 1 and op in _UNARY_OPS:
+                return ast.UnaryOp(op=_UNARY_OPS[op](), operand=self.visit(cond, args[0]))
+
+        # other operators are called as functions
+        return ast.Call(
+            func=self._global('o', op),
+            args=[self.visit(cond, arg) for arg in args],
+            keywords=[ast.keyword(arg=k, value=self.visit(cond, v)) for k, v in kwargs.items()],
+        )
+
+    def visit(self, cond: bool, node) -> ast.expr:
+        if id(node) in self.names:  # evaluated before
+            return _load(self.names[id(node)])
+        elif self.counts[id(node)] > 1 and not cond and not _is_const(node):  # save the value for later use
+            # values in conditional branches may not be evaluated, so they are not saved
+            name = f'_v{len(self.names)}'
+            self.names[id(node)] = name
+            return ast.NamedExpr(target=ast.Name(id=name, ctx=ast.Store()), value=self._node(node, cond))
+        else:
+            return self._node(node, cond)
+
+    def compile(self) -> Callable:
+        arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg='x')], vararg=None,
+                                  kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+        tree = ast.Expression(body=ast.Lambda(args=arguments, body=self.visit(False, self.root)))
+        code = compile(ast.fix_missing_locations(tree), '<expression>', 'eval')
+        return eval(code, self.globals)
+
+
+def cfunc(e) -> Callable:
+    """
+    Overview:
+        Get compiled callable object from any types. The whole expression is compiled to one python function \
+        with python's own compiler, so only one python frame is used when calling it, instead of one frame \
+        per node.
+
+    :param e: Original object.
+    :return: Callable object, which returns the same result as :func:`efunc`.
+
+    .. note::
+        Compiling takes some time, so it is recommended when the compiled function will be called many times.
+
+    .. note::
+        The same node used multiple times in the expression will be evaluated only once, and the short-circuit \
+        operators (such as ``x & y`` in :class:`LogicalExpression`) are compiled to python's ``and`` and ``or``.
+
+    Examples::
+        >>> from hbutils.expression import keep, cfunc
+        >>>
+        >>> e = keep()
+        >>> f = cfunc((e['a'] + 1) * e['b'] > 10)
+        >>> f({'a': 1, 'b': 5})
+        False
+        >>> f({'a': 1, 'b': 6})
+        True
+    """
+    return _Compiler(_raw_expr(e)).compile()
@@ -1,4 +1,6 @@
-from .base import Expression
+import operator
+
+from .base import Expression, _pure, _raw_expr, _FOLD_CHECKS, _safe_product
 
 __all__ = [
     'CheckExpression',
@@ -11,6 +13,64 @@ __all__ = [
 ]
 
 
+@_pure
+def _sum(x, *args):
+    for v in args:
+        x = x + v
+    return x
+
+
+@_pure
+def _product(x, *args):
+    for v in args:
+        x = x * v
+    return x
+
+
+_FOLD_CHECKS[_product] = _safe_product
+
+
+def _and(x, y):
+    return x and y
+
+
+def _or(x, y):
+    return x or y
+
+
+# operators whose right operand is evaluated only when necessary
+_SHORT_CIRCUIT_OPS = {_and, _or}
+
+# max arguments of flattened chains, longer chains are split to keep the building linear
+_CHAIN_MAX_ARGS = 32
+
+
+def _call(s, *args, **kwargs):
+    return s(*args, **kwargs)
+
+
+# the operator methods share the same code objects, only the operator function is different
+def _binary(func):
+    def _method(self, other):
+        return self._func(func, self, other)
+
+    return _method
+
+
+def _reflected(func):
+    def _method(self, other):
+        return self._func(func, other, self)
+
+    return _method
+
+
+def _unary(func):
+    def _method(self):
+        return self._func(func, self)
+
+    return _method
+
+
 class CheckExpression(Expression):
     """
     Overview:
@@ -20,12 +80,10 @@ class CheckExpression(Expression):
         * ``__eq__``, which means ``x == y``.
         * ``__ne__``, which means ``x == y``.
     """
+    __slots__ = ()
 
-    def __eq__(self, other):
-        return self._func(lambda x, y: x == y, self, other)
-
-    def __ne__(self, other):
-        return self._func(lambda x, y: x != y, self, other)
+    __eq__ = _binary(operator.eq)
+    __ne__ = _binary(operator.ne)
 
 
 class ComparableExpression(CheckExpression):
@@ -41,18 +99,12 @@ class ComparableExpression(CheckExpression):
         * ``__le__``, which means ``x <= y``.
         * ``__lt__``, which means ``x < y``.
     """
+    __slots__ = ()
 
-    def __le__(self, other):
-        return self._func(lambda x, y: x <= y, self, other)
-
-    def __lt__(self, other):
-        return self._func(lambda x, y: x < y, self, other)
-
-    def __ge__(self, other):
-        return self._func(lambda x, y: x >= y, self, other)
-
-    def __gt__(self, other):
-        return self._func(lambda x, y: x > y, self, other)
+    __le__ = _binary(operator.le)
+    __lt__ = _binary(operator.lt)
+    __ge__ = _binary(operator.ge)
+    __gt__ = _binary(operator.gt)
 
 
 class IndexedExpression(Expression):
@@ -63,9 +115,9 @@ class IndexedExpression(Expression):
     Features:
         * ``__getitem__``, which means ``x[y]``.
     """
+    __slots__ = ()
 
-    def __getitem__(self, item):
-        return self._func(lambda x, y: x[y], self, item)
+    __getitem__ = _binary(operator.getitem)
 
 
 class ObjectExpression(Expression):
@@ -77,12 +129,12 @@ class ObjectExpression(Expression):
         * ``__getattr__``, which means ``x.y``.
         * ``__call__``, which means ``x(*args, **kwargs)``.
     """
+    __slots__ = ()
 
-    def __getattr__(self, item):
-        return self._func(lambda x, y: getattr(x, y), self, item)
+    __getattr__ = _binary(getattr)
 
     def __call__(self, *args, **kwargs):
-        return self._func(lambda s, *args_, **kwargs_: s(*args_, **kwargs_), self, *args, **kwargs)
+        return self._func(_call, self, *args, **kwargs)
 
 
 class LogicalExpression(Expression):
@@ -97,22 +149,50 @@ class LogicalExpression(Expression):
 
     .. note::
         Do not use this with :class:`BitwiseExpression`, or unexpected conflict will be caused.
+
+    .. note::
+        Like python's ``and`` and ``or``, the right operand will not be evaluated when the result is \
+        decided by the left operand.
     """
+    __slots__ = ()
+
+    def _logical(self, func, x, y):
+        x, y = _raw_expr(x), _raw_expr(y)
+        fx, yc = getattr(x, '_fcall'), getattr(y, '_const')
+        if yc is not None:  # constant right operand, no need to call it
+            yv, = yc
+            if func is _and:
+                def _new_func(v):
+                    return fx(v) and yv
+            else:
+                def _new_func(v):
+                    return fx(v) or yv
+        else:
+            fy = getattr(y, '_fcall')
+            if func is _and:
+                def _new_func(v):
+                    return fx(v) and fy(v)
+            else:
+                def _new_func(v):
+                    return fx(v) or fy(v)
+
+        e = self.__class__(_new_func)
+        e._op, e._args, e._kwargs = func, (x, y), {}
+        return e
 
     def __and__(self, other):
-        return self._func(lambda x, y: x and y, self, other)
+        return self._logical(_and, self, other)
 
     def __rand__(self, other):
-        return self._func(lambda x, y: x and y, other, self)
+        return self._logical(_and, other, self)
 
     def __or__(self, other):
-        return self._func(lambda x, y: x or y, self, other)
+        return self._logical(_or, self, other)
 
     def __ror__(self, other):
-        return self._func(lambda x, y: x or y, other, self)
+        return self._logical(_or, other, self)
 
-    def __invert__(self):
-        return self._func(lambda x: not x, self)
+    __invert__ = _unary(operator.not_)
 
 
 class MathExpression(Expression):
@@ -130,55 +210,41 @@ class MathExpression(Expression):
         * ``__pow__``, which means ``x ** y``.
         * ``__pos__``, which means ``+x``.
         * ``__neg__``, which means ``-x``.
-    """
 
-    def __add__(self, other):
-        return self._func(lambda x, y: x + y, self, other)
+    .. note::
+        Chains like ``x + y + z`` and ``x * y * z`` are flattened into one node, which is evaluated from \
+        left to right, so the tree will not grow deeper for long chains. Very long chains are split into \
+        nodes with at most 32 operands, so that the building time is not quadratic.
+    """
+    __slots__ = ()
 
-    def __radd__(self, other):
-        return self._func(lambda x, y: x + y, other, self)
+    def _chain(self, func):
+        if self._op is func and len(self._args) < _CHAIN_MAX_ARGS:
+            return self._args
+        else:
+            return self,
 
-    def __sub__(self, other):
-        return self._func(lambda x, y: x - y, self, other)
+    def __add__(self, other):
+        return self._func(_sum, *self._chain(_sum), other)
 
-    def __rsub__(self, other):
-        return self._func(lambda x, y: x - y, other, self)
+    __radd__ = _reflected(_sum)
+    __sub__ = _binary(operator.sub)
+    __rsub__ = _reflected(operator.sub)
 
     def __mul__(self, other):
-        return self._func(lambda x, y: x * y, self, other)
-
-    def __rmul__(self, other):
-        return self._func(lambda x, y: x * y, other, self)
-
-    def __truediv__(self, other):
-        return self._func(lambda x, y: x / y, self, other)
-
-    def __rtruediv__(self, other):
-        return self._func(lambda x, y: x / y, other, self)
-
-    def __floordiv__(self, other):
-        return self._func(lambda x, y: x // y, self, other)
-
-    def __rfloordiv__(self, other):
-        return self._func(lambda x, y: x // y, other, self)
-
-    def __mod__(self, other):
-        return self._func(lambda x, y: x % y, self, other)
-
-    def __rmod__(self, other):
-        return self._func(lambda x, y: x % y, other, self)
-
-    def __pow__(self, power):
-        return self._func(lambda x, y: x ** y, self, power)
-
-    def __rpow__(self, other):
-        return self._func(lambda x, y: x ** y, other, self)
-
-    def __pos__(self):
-        return self._func(lambda x: +x, self)
+        return self._func(_product, *self._chain(_product), other)
 
-    def __neg__(self):
-        return self._func(lambda x: -x, self)
+    __rmul__ = _reflected(_product)
+    __truediv__ = _binary(operator.truediv)
+    __rtruediv__ = _reflected(operator.truediv)
+    __floordiv__ = _binary(operator.floordiv)
+    __rfloordiv__ = _reflected(operator.floordiv)
+    __mod__ = _binary(operator.mod)
+    __rmod__ = _reflected(operator.mod)
+    __pow__ = _binary(operator.pow)
+    __rpow__ = _reflected(operator.pow)
+    __pos__ = _unary(operator.pos)
+    __neg__ = _unary(operator.neg)
 
 
 class BitwiseExpression(Expression):
@@ -197,36 +263,16 @@ class BitwiseExpression(Expression):
     .. note::
         Do not use this with :class:`LogicalExpression`, or unexpected conflict will be caused.
     """
-
-    def __or__(self, other):
-        return self._func(lambda x, y: x | y, self, other)
-
-    def __ror__(self, other):
-        return self._func(lambda x, y: x | y, other, self)
-
-    def __xor__(self, other):
-        return self._func(lambda x, y: x ^ y, self, other)
-
-    def __rxor__(self, other):
-        return self._func(lambda x, y: x ^ y, other, self)
-
-    def __and__(self, other):
-        return self._func(lambda x, y: x & y, self, other)
-
-    def __rand__(self, other):
-        return self._func(lambda x, y: x & y, other, self)
-
-    def __invert__(self):
-        return self._func(lambda x: ~x, self)
-
-    def __lshift__(self, other):
-        return self._func(lambda x, y: x << y, self, other)
-
-    def __rlshift__(self, other):
-        return self._func(lambda x, y: x << y, other, self)
-
-    def __rshift__(self, other):
-        return self._func(lambda x, y: x >> y, self, other)
-
-    def __rrshift__(self, other):
-        return self._func(lambda x, y: x >> y, other, self)
+    __slots__ = ()
+
+    __or__ = _binary(operator.or_)
+    __ror__ = _reflected(operator.or_)
+    __xor__ = _binary(operator.xor)
+    __rxor__ = _reflected(operator.xor)
+    __and__ = _binary(operator.and_)
+    __rand__ = _reflected(operator.and_)
+    __invert__ = _unary(operator.invert)
+    __lshift__ = _binary(operator.lshift)
+    __rlshift__ = _reflected(operator.lshift)
+    __rshift__ = _binary(operator.rshift)
+    __rrshift__ = _reflected(operator.rshift)
@@ -24,7 +24,11 @@ class GeneralExpression(
         Inherited from :class:`ComparableExpression`, :class:`IndexedExpression`, :class:`ObjectExpression`, \
         :class:`LogicalExpression` and :class:`MathExpression`.
     """
-    pass
+    __slots__ = ()
+
+
+_KEEP = GeneralExpression(lambda x: x)
+_GENERAL_EXPR = getattr(GeneralExpression, '_expr')
 
 
 def expr(v, cls: Optional[Type[Expression]] = None):
@@ -41,8 +45,12 @@ def expr(v, cls: Optional[Type[Expression]] = None):
         means :class:`GeneralExpression` will be used.
     :return: Generated expression.
     """
-    cls = cls or GeneralExpression
-    return getattr(cls, '_expr')(v)
+    if isinstance(v, Expression):
+        return v
+    elif cls is None:
+        return _GENERAL_EXPR(v)
+    else:
+        return getattr(cls, '_expr')(v)
 
 
 def keep(cls: Optional[Type[Expression]] = None):
@@ -53,7 +61,12 @@ def keep(cls: Optional[Type[Expression]] = None):
     :param cls: Class of expression, should be a subclass of :class:`Expression`. Default is ``None`` which \
         means :class:`GeneralExpression` will be used.
     :return: Generated expression.
+
+    .. note::
+        When ``cls`` is not given, the same expression object will be returned.
     """
+    if cls is None:
+        return _KEEP
     return expr(lambda x: x, cls)
 
 
@@ -67,4 +80,5 @@ def raw(v, cls: Optional[Type[Expression]] = None):
         means :class:`GeneralExpression` will be used.
     :return: Generated expression.
     """
-    return expr(lambda x: v, cls)
+    cls = cls or GeneralExpression
+    return getattr(cls, '_raw')(v)
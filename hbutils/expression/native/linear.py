@@ -0,0 +1,89 @@
+"""
+Overview:
+    Linearized evaluation of native expressions, the tree is flattened to a post-order list of operations, \
+    which can be evaluated in one loop without recursion.
+"""
+from typing import Callable, List, Tuple
+
+from .base import _raw_expr
+from .feature import _SHORT_CIRCUIT_OPS
+
+__all__ = [
+    'linearize', 'lfunc',
+]
+
+
+def linearize(e) -> Tuple[List[Callable], List[Tuple[int, ...]]]:
+    """
+    Overview:
+        Linearize the given expression to a post-order list of operations.
+
+    :param e: Original object.
+    :return: Tuple of operations and operands. The ``i``-th operation's result is stored in the ``i``-th slot, \
+        and its operands are the indices of the earlier slots, while ``-1`` means the input value. \
+        The result of the last slot is the value of the whole expression.
+
+    .. note::
+        The same node used multiple times in the expression will only occupy one slot, and nodes with \
+        key-word arguments or short-circuit operators (such as ``x & y`` in :class:`LogicalExpression`) \
+        are treated as leaf nodes.
+
+    Examples::
+        >>> from hbutils.expression import keep, linearize
+        >>>
+        >>> e = keep()
+        >>> ops, operands = linearize((e + 1) * e)
+        >>> len(ops)
+        4
+        >>> operands
+        [(-1,), (-1,), (0, 1), (2, 0)]
+    """
+    ops, operands = [], []
+    slots = {}
+
+    def _recursion(node) -> int:
+        if id(node) not in slots:
+            op, args = getattr(node, '_op'), getattr(node, '_args')
+            if op is not None and op not in _SHORT_CIRCUIT_OPS and not getattr(node, '_kwargs'):
+                idxs = tuple(_recursion(arg) for arg in args)
+                ops.append(op)
+                operands.append(idxs)
+            else:
+                ops.append(getattr(node, '_fcall'))
+                operands.append((-1,))
+            slots[id(node)] = len(ops) - 1
+
+        return slots[id(node)]
+
+    _recursion(_raw_expr(e))
+    return ops, operands
+
+
+def lfunc(e) -> Callable:
+    """
+    Overview:
+        Get linearized callable object from any types. The expression is evaluated with the result of \
+        :func:`linearize` in one loop, instead of one python frame per node.
+
+    :param e: Original object.
+    :return: Callable object, which returns the same result as :func:`efunc`.
+
+    Examples::
+        >>> from hbutils.expression import keep, lfunc
+        >>>
+        >>> e = keep()
+        >>> f = lfunc((e + 1) * e)
+        >>> f(2)
+        6
+        >>> f(3)
+        12
+    """
+    program = tuple(zip(*linearize(e)))
+
+    def _func(x):
+        values = []
+        for op, idxs in program:
+            values.append(op(*[x if i < 0 else values[i] for i in idxs]))
+        return values[-1]
+
+    return _func
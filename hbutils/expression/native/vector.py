@@ -0,0 +1,172 @@
+"""
+Overview:
+    Vectorized evaluation of native expressions, which is useful when the expressions are applied on \
+    large arrays (such as ``numpy.ndarray``).
+"""
+import operator
+from typing import Callable, List, Set, Tuple
+
+from .base import _raw_expr
+from .feature import _sum, _product
+
+try:
+    import numpy as np
+    import numexpr
+except ImportError:  # pragma: no cover
+    np, numexpr = None, None
+
+__all__ = [
+    'vfunc',
+]
+
+_BINARY_OPS = {
+    operator.add: '+',
+    operator.sub: '-',
+    operator.mul: '*',
+    operator.truediv: '/',
+    operator.floordiv: '//',
+    operator.mod: '%',
+    operator.pow: '**',
+    operator.eq: '==',
+    operator.ne: '!=',
+    operator.le: '<=',
+    operator.lt: '<',
+    operator.ge: '>=',
+    operator.gt: '>',
+    operator.and_: '&',
+    operator.or_: '|',
+    operator.xor: '^',
+    operator.lshift: '<<',
+    operator.rshift: '>>',
+}
+_VARIADIC_OPS = {
+    _sum: '+',
+    _product: '*',
+}
+_UNARY_OPS = {
+    operator.pos: '+',
+    operator.neg: '-',
+    operator.invert: '~',
+}
+
+# operators which can be evaluated by numexpr with the same semantics as numpy
+_NUMEXPR_OPS = {
+    operator.add, operator.sub, operator.mul, operator.truediv, operator.mod, operator.pow,
+    operator.eq, operator.ne, operator.le, operator.lt, operator.ge, operator.gt,
+    operator.lshift, operator.rshift, operator.neg, _sum, _product,
+}
+# dtype kinds supported by numexpr (boolean, signed and unsigned integer, floating)
+_NUMEXPR_KINDS = 'biuf'
+
+
+def _render(e) -> Tuple[str, List[Callable], Set[Callable]]:
+    """
+    Render the given expression to a source string.
+
+    :param e: Expression object.
+    :return: Tuple of source string, functions of the variables (named ``v0``, ``v1``, ...) \
+        used in source string, and the operators used in source string.
+    """
+    names, funcs = {}, []
+    ops = set()
+
+    def _recursion(node) -> str:
+        op, args = getattr(node, '_op'), getattr(node, '_args')
+        if not getattr(node, '_kwargs'):
+            if len(args) == 2 and op in _BINARY_OPS:
+                ops.add(op)
+                return f'({_recursion(args[0])} {_BINARY_OPS[op]} {_recursion(args[1])})'
+            elif len(args) >= 2 and op in _VARIADIC_OPS:
+                ops.add(op)
+                return '(' + f' {_VARIADIC_OPS[op]} '.join(map(_recursion, args)) + ')'
+            elif len(args) == 1 and op in _UNARY_OPS:
+                ops.add(op)
+                return f'({_UNARY_OPS[op]}{_recursion(args[0])})'
+
+        # leaf nodes and unsupported operators are evaluated by themselves
+        if id(node) not in names:
+            names[id(node)] = f'v{len(funcs)}'
+            funcs.append(getattr(node, '_fcall'))
+        return names[id(node)]
+
+    return _recursion(e), funcs, ops
+
+
+def vfunc(e) -> Callable:
+    """
+    Overview:
+        Get vectorized callable object from any types. The arithmetic and comparison parts of the expression \
+        are fused into one formula, so that only one python frame is used for the whole formula instead \
+        of one frame per node.
+
+    :param e: Original object.
+    :return: Callable object, which returns the same result as :func:`efunc`.
+
+    .. note::
+        When `numexpr <https://github.com/pydata/numexpr>`_ is installed, and all the operators in the formula \
+        are supported by it, the formula will be evaluated by numexpr when ``numpy.ndarray`` is involved, which \
+        is much faster than numpy on large arrays because the intermediate values are not allocated. \
+        Numexpr is only used when the result has the same dtype as numpy's, and powers of integers are always \
+        left to numpy. Otherwise, the formula will be compiled to native python code once, and evaluated with it.
+
+    .. note::
+        Leaf nodes and unsupported operators (such as ``x[y]`` and ``x.y``) are evaluated as before, and the same \
+        node used multiple times in the formula will be evaluated only once.
+
+    Examples::
+        >>> import numpy as np
+        >>> from hbutils.expression import keep, vfunc
+        >>>
+        >>> e = keep()
+        >>> vfunc(e * 2 + e ** 2 - 1)(np.array([1, 2, 3]))
+        array([ 2,  7, 14])
+        >>> vfunc(e * 2 + e ** 2 - 1)(3)  # scalar is supported as well
+        14
+    """
+    source, funcs, ops = _render(_raw_expr(e))
+    names = [f'v{i}' for i in range(len(funcs))]
+    _func_python = eval(compile(f'lambda {", ".join(names)}: {source}', '<expression>', 'eval'), {})
+
+    if numexpr is not None and ops <= _NUMEXPR_OPS:
+        # integer powers are left to python, which raises or turns to float on negative exponents instead of truncating
+        _int_pow = operator.pow in ops
+        _dtypes = {}  # result dtype of numpy, for the dtypes of the variables
+
+        def _numpy_dtype(values):
+            key = tuple(v.dtype if isinstance(v, np.ndarray) else type(v) for v in values)
+            if key not in _dtypes:
+                try:
+                    with np.errstate(all='ignore'):
+                        result = _func_python(*(v.ravel()[:1] if isinstance(v, np.ndarray) else v for v in values))
+                    _dtypes[key] = result.dtype
+                except Exception:
+                    _dtypes[key] = None
+            return _dtypes[key]
+
+        def _numexpr_able(v):
+            if isinstance(v, np.ndarray):
+                return v.dtype.kind in _NUMEXPR_KINDS and not (_int_pow and v.dtype.kind in 'biu')
+            else:
+                return isinstance(v, float) or (isinstance(v, int) and not (_int_pow and v < 0))
+
+        def _func(x):
+            values = [f(x) for f in funcs]
+            if any(isinstance(v, np.ndarray) for v in values) and all(map(_numexpr_able, values)):
+                dtype = _numpy_dtype(values)
+                if dtype is not None:
+                    try:
+                        result = numexpr.evaluate(source, local_dict=dict(zip(names, values)))
+                    except Exception:
+                        pass
+                    else:
+                        # numexpr casts small types up, then the result of numpy is used instead
+                        if result.dtype == dtype:
+                            return result
+
+            return _func_python(*values)
+
+    else:
+        def _func(x):
+            return _func_python(*(f(x) for f in funcs))
+
+    return _func
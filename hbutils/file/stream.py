@@ -4,16 +4,15 @@ Overview:
 """
 import io
 import os
-from contextlib import contextmanager
-from typing import Union, TextIO, BinaryIO, ContextManager
+import weakref
+from typing import Union, TextIO, BinaryIO
 
 __all__ = [
     'keep_cursor', 'getsize', 'is_eof',
 ]
 
 
-@contextmanager
-def keep_cursor(file: Union[TextIO, BinaryIO]) -> ContextManager:
+class keep_cursor:
     """
     Overview:
         Keep the cursor of the given file within a with-block.
@@ -42,24 +41,42 @@ def keep_cursor(file: Union[TextIO, BinaryIO]) -> ContextManager:
 
     .. note::
         Only seekable stream can use :func:`keep_cursor`.
+
+    .. note::
+        The same :class:`keep_cursor` object can be used again after it is exited, but it can not be \
+        entered again within its with-block, otherwise ``RuntimeError`` will be raised.
     """
-    if file.seekable():
-        curpos = file.tell()
-        try:
-            yield
-        finally:
-            file.seek(curpos, io.SEEK_SET)
-    else:
-        raise OSError(f'Given file {repr(file)} is not seekable, '  # pragma: no cover
-                      f'so its cursor position cannot be kept.')
+    __slots__ = ('_file', '_curpos')
+
+    def __init__(self, file: Union[TextIO, BinaryIO]):
+        self._file = file
+        self._curpos = None
+
+    def __enter__(self):
+        if self._curpos is not None:
+            raise RuntimeError(f'Cursor of {self._file!r} is already kept by this object, '
+                               f'which can not be entered again before exited.')
+        if self._file.seekable():
+            self._curpos = self._file.tell()
+        else:
+            raise OSError(f'Given file {repr(self._file)} is not seekable, '  # pragma: no cover
+                          f'so its cursor position cannot be kept.')
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        curpos, self._curpos = self._curpos, None
+        self._file.seek(curpos, io.SEEK_SET)
 
 
-def getsize(file: Union[TextIO, BinaryIO]) -> int:
+_SIZE_CACHE = weakref.WeakKeyDictionary()
+
+
+def getsize(file: Union[TextIO, BinaryIO], fresh: bool = False) -> int:
     """
     Overview:
         Get the size of the given ``file`` stream.
 
     :param file: File which size need to access.
+    :param fresh: Get the fresh size without cache. Default is ``False``.
     :return: File's size.
 
     Examples::
@@ -75,24 +92,48 @@ def getsize(file: Union[TextIO, BinaryIO]) -> int:
 
     .. note::
         Only seekable stream can use :func:`getsize`.
+
+    .. note::
+        The size of non-writable stream (such as files opened with ``r`` or ``rb`` mode) will be cached \
+        when it is accessed for the first time. If the file may be changed by others (e.g. appended by \
+        another process), please use ``fresh=True`` to get its latest size.
     """
-    if file.seekable():
+    if isinstance(file, io.BytesIO):
+        with file.getbuffer() as buffer:
+            return len(buffer)
+    elif file.seekable():
+        if not fresh:
+            try:
+                size = _SIZE_CACHE.get(file, None)
+            except TypeError:  # not weak referable or not hashable, so it is never cached
+                size = None
+            if size is not None:
+                return size
+
         try:
-            return os.stat(file.fileno()).st_size
+            size = os.fstat(file.fileno()).st_size
         except OSError:
             with keep_cursor(file):
-                return file.seek(0, io.SEEK_END)
+                size = file.seek(0, io.SEEK_END)
+
+        if not file.writable():
+            try:
+                _SIZE_CACHE[file] = size
+            except TypeError:
+                pass
+        return size
     else:
         raise OSError(f'Given file {repr(file)} is not seekable, '  # pragma: no cover
                       f'so its size is unavailable.')
 
 
-def is_eof(file: Union[TextIO, BinaryIO]) -> bool:
+def is_eof(file: Union[TextIO, BinaryIO], fresh: bool = False) -> bool:
     """
     Overview:
         Check if the file meets its end.
 
     :param file: File to be checked.
+    :param fresh: Use the fresh size of file without cache, see :func:`getsize`. Default is ``False``.
     :return: Is EOF(end of file) or not.
 
     Examples::
@@ -120,5 +161,19 @@ def is_eof(file: Union[TextIO, BinaryIO]) -> bool:
 
     .. note::
         Only seekable stream can use :func:`is_eof`.
+
+    .. note::
+        For :class:`io.BytesIO` and buffered binary readers (such as files opened with ``rb`` mode), \
+        the end of file is checked without getting the size of the whole file, unless there is no data \
+        after the cursor. When the cursor is moved beyond the end, it is not regarded as the end of file.
     """
-    return file.tell() == getsize(file)
+    if isinstance(file, io.BytesIO):
+        with file.getbuffer() as buffer:
+            return file.tell() == len(buffer)
+    elif hasattr(file, 'peek') and file.seekable():
+        if file.peek(1):
+            return False
+        else:  # the cursor may be moved beyond the end, which is not the end of file
+            return file.tell() == getsize(file, fresh)
+    else:
+        return file.tell() == getsize(file, fresh)
@@ -2,8 +2,10 @@
 Overview:
     Useful functions for build class models.
 """
-import os
+import keyword
+import operator
 import textwrap
+import types
 from typing import Optional, Iterable
 
 from ._info import _PACKAGE_RST
@@ -20,8 +22,8 @@ CLASS_WRAPPER_UPDATES = ()
 
 
 def _cls_field_name(cls: type, name: str):
-    if name.startswith('__'):
-        return f'_{cls.__name__.lstrip("_")}__{name[2:]}'
+    if name[:2] == '__':
+        return _cls_private_prefix(cls) + name[2:]
     else:
         return name
 
@@ -48,7 +50,9 @@ def get_field(obj, name: str, default=_NO_DEFAULT_VALUE):
 
 
 def _cls_private_prefix(cls):
-    cls_name = cls.__name__.lstrip('_')
+    cls_name = cls.__name__
+    if cls_name[:1] == '_':  # most class names have no leading underscores, so lstrip is not needed
+        cls_name = cls_name.lstrip('_')
     return f'_{cls_name}__'
 
 
@@ -56,27 +60,66 @@ def _auto_get_items_from_cls(cls):
     return cls.__items__
 
 
-def _auto_get_items(obj, cls_prefix=None):
-    _type = type(obj)
+def _auto_get_cls_items(cls, cls_prefix: str):
+    # private fields defined in the class level (including __slots__), they are the same for all the instances
+    items = set()
+    for clazz in cls.__mro__:
+        for name in clazz.__dict__:
+            if name.startswith(cls_prefix):
+                items.add(name[len(cls_prefix):])
+
+    return items
+
+
+def _auto_get_items(obj, cls_prefix: str, cls_items=()):
     try:
-        return _auto_get_items_from_cls(_type)
+        return _auto_get_items_from_cls(type(obj))
     except AttributeError:
-        cls_prefix = cls_prefix or _cls_private_prefix(_type)
-
-        items = []
-        for name in dir(obj):
+        # only the instance's fields are searched here, dir(obj) is not used because it lists
+        # and sorts all the attributes of the whole class hierarchy on every call
+        items = set(cls_items)
+        for name in getattr(obj, '__dict__', ()):
             if name.startswith(cls_prefix):
-                items.append(name[len(cls_prefix):])
+                items.add(name[len(cls_prefix):])
 
         return sorted(items)
 
 
-def _get_value(self, vname: str, cls_prefix=None):
-    cls_prefix = cls_prefix or _cls_private_prefix(type(self))
-    try:
-        return getattr(self, vname)
-    except AttributeError:
-        return getattr(self, cls_prefix + vname)
+def _get_value(self, vname: str, cls_prefix: str):
+    # getattr with default value does not create the AttributeError object when the field is not found
+    value = getattr(self, vname, _NO_DEFAULT_VALUE)
+    if value is _NO_DEFAULT_VALUE:
+        value = getattr(self, cls_prefix + vname)
+    return value
+
+
+_INDENT = ' ' * 4
+
+
+def _attr_code(obj: str, name: str) -> str:
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return f'{obj}.{name}'
+    else:
+        return f'getattr({obj}, {name!r})'
+
+
+def _value_code(target: str, obj: str, vname: str, cls_prefix: str, indent: str):
+    # generated version of _get_value, the value is assigned to the local variable target
+    return [
+        f'{indent}{target} = getattr({obj}, {vname!r}, _no_value)',
+        f'{indent}if {target} is _no_value:',
+        f'{indent}{_INDENT}{target} = {_attr_code(obj, cls_prefix + vname)}',
+    ]
+
+
+def _static_items(cls, items: Optional[Iterable]):
+    if items is None:
+        try:
+            return list(_auto_get_items_from_cls(cls))
+        except AttributeError:
+            return None  # private fields will be found on the instances
+    else:
+        return list(items)
 
 
 def asitems(items: Iterable[str]):
@@ -108,13 +151,21 @@ def asitems(items: Iterable[str]):
     """
 
     def _decorator(cls):
-        _cls_prefix = _cls_private_prefix(cls)
         cls.__items__ = list(items)
         return cls
 
     return _decorator
 
 
+# templates of the docstrings are created only once, only the class name is filled in when decorating
+_REPR_DOC = textwrap.dedent(f"""
+Get representation format of class {{cls}}.
+
+.. note::
+    Created by {_PACKAGE_RST}, v{__VERSION__}.
+""")
+
+
 def visual(items: Optional[Iterable] = None, show_id: bool = False):
     """
     Overview:
@@ -140,22 +191,11 @@ def visual(items: Optional[Iterable] = None, show_id: bool = False):
 
     def _decorator(cls):
         _cls_prefix = _cls_private_prefix(cls)
+        _cls_items = _auto_get_cls_items(cls, _cls_prefix)
 
-        def _get_items(self):
-            if items is None:
-                return _auto_get_items(self, _cls_prefix)
-            else:
-                return items
-
-        def __repr__(self):
-            f"""
-            Get representation format of class {cls.__name__}.
-
-            .. note::
-                Created by {_PACKAGE_RST}, v{__VERSION__}.
-            """
+        def _dynamic_repr(self):
             str_items = []
-            for item in _get_items(self):
+            for item in _auto_get_items(self, _cls_prefix, _cls_items):
                 if isinstance(item, str):
                     _name, _repr = item, repr
                 else:
@@ -180,16 +220,126 @@ def visual(items: Optional[Iterable] = None, show_id: bool = False):
                 str_sentences = ''
             return f'<{type(self).__name__}{str_sentences}>'
 
-        cls.__repr__ = __repr__
+        _items = _static_items(cls, items)
+        if _items is not None:
+            # the items are known now, so the loop is unrolled in the generated code
+            fres = {'_no_value': _NO_DEFAULT_VALUE, '_dynamic_repr': _dynamic_repr}
+            names, lines, fallback = [], ['def __repr__(self):'], [f'{_INDENT}str_items = []']
+            if items is None:
+                # subclasses may redefine __items__, then the items should be found when called
+                fres['_cls_items_obj'] = cls.__items__
+                lines.extend([
+                    f'{_INDENT}if type(self).__items__ is not _cls_items_obj:',
+                    f'{_INDENT * 2}return _dynamic_repr(self)',
+                ])
+            for i, item in enumerate(_items):
+                if isinstance(item, str):
+                    _name, _repr = item, repr
+                else:
+                    _name, _repr = item
+
+                names.append(_name)
+                fres[f'_repr_{i}'] = _repr
+                lines.extend(_value_code(f'_v{i}', 'self', _name, _cls_prefix, _INDENT))
+                lines.extend([
+                    f'{_INDENT}try:',
+                    f'{_INDENT * 2}_r{i} = _repr_{i}(_v{i})',
+                    f'{_INDENT}except ValueError:',
+                    f'{_INDENT * 2}_r{i} = _no_value',
+                ])
+                fallback.extend([
+                    f'{_INDENT}if _r{i} is not _no_value:',
+                    f'{_INDENT * 2}str_items.append({_name + ": "!r} + format(_r{i}))',
+                ])
+
+            # all the items are formatted at once, when no ValueError is raised
+            _format = '<%s' + (' %s' if show_id else '')
+            if names:
+                _format += ' ' + ', '.join(f'{name.replace("%", "%%")}: %s' for name in names)
+            _format += '>'
+            _args = ['type(self).__name__', *(['hex(id(self))'] if show_id else []),
+                     *(f'_r{i}' for i in range(len(names)))]
+            _return = f"return {_format!r} % ({', '.join(_args)},)"
+            if names:
+                # the items whose repr raised ValueError are skipped
+                _head = "'<' + type(self).__name__" + (" + ' ' + hex(id(self))" if show_id else '')
+                lines.extend([
+                    f"{_INDENT}if {' and '.join(f'_r{i} is not _no_value' for i in range(len(names)))}:",
+                    f'{_INDENT * 2}{_return}',
+                    *fallback,
+                    f"{_INDENT}return {_head} + (' ' + ', '.join(str_items) if str_items else '') + '>'",
+                ])
+            else:
+                lines.append(f'{_INDENT}{_return}')
+
+            exec('\n'.join(lines), fres)
+            __repr__ = fres['__repr__']
+
+        else:
+            __repr__ = _dynamic_repr
+
+        cls.__repr__ = fassign(__doc__=_REPR_DOC.format(cls=cls.__name__))(__repr__)
         return cls
 
     return _decorator
 
 
-_INDENT = ' ' * 4
+_INIT_DOC = textwrap.dedent(f'''
+Constructor of class {{cls}}.
+
+.. note::
+    Created by {_PACKAGE_RST}, v{__VERSION__}.
+
+    The values of arguments supplied to this constructor \
+    will be put into the fields specified.
+''')
+
+# compiled code of the generated constructors, classes with the same fields can share it
+_INIT_CODE_CACHE = {}
+
+
+def _slotted_functions(member):
+    if isinstance(member, (classmethod, staticmethod)):
+        yield member.__func__
+    elif isinstance(member, property):
+        yield from (func for func in (member.fget, member.fset, member.fdel) if func is not None)
+    elif isinstance(member, types.FunctionType):
+        yield member
+
+
+def _slotted_class(cls: type, slots: Iterable[str]) -> type:
+    # __slots__ can not be added to an existing class, so a new class with the same members is created
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'Class {cls.__name__!r} already specifies __slots__.')
 
+    slots = tuple(slots)
+    members = dict(cls.__dict__)
+    members.pop('__dict__', None)
+    if members.pop('__weakref__', None) is not None:
+        # the weak references should still be supported, when they are not provided by the base classes
+        slots += ('__weakref__',)
+    for name in slots:
+        # class attributes with the same names will conflict with the slots
+        members.pop(name, None)
+    members['__slots__'] = slots
+    members['__qualname__'] = cls.__qualname__
+    new_cls = type(cls)(cls.__name__, cls.__bases__, members)
 
-def constructor(params: Optional[Iterable] = None, doc: Optional[str] = None):
+    # the __class__ cells used by zero-argument super() should refer to the new class
+    for member in new_cls.__dict__.values():
+        for func in _slotted_functions(member):
+            for cell in func.__closure__ or ():
+                try:
+                    contents = cell.cell_contents
+                except ValueError:  # empty cell
+                    continue
+                if contents is cls:
+                    cell.cell_contents = new_cls
+
+    return new_cls
+
+
+def constructor(params: Optional[Iterable] = None, doc: Optional[str] = None, slots: bool = False):
     r"""
     Overview:
         Decorate class to create a init function.
@@ -199,10 +349,23 @@ def constructor(params: Optional[Iterable] = None, doc: Optional[str] = None):
             each item should be a single string or a tuple of string and default value. Default is `None`, \
             which means no arguments.
         - doc (:obj:`Optional[str]`): Documentation of constructor function.
+        - slots (:obj:`bool`): Store the fields in ``__slots__`` instead of ``__dict__``. Default is `False`.
 
     Returns:
         - decorator: Decorator to decorate the given class.
 
+    .. note::
+        When ``slots`` is `True`, a new class with the same members is created by ``type(cls)(...)`` and \
+        returned instead of the given class, because ``__slots__`` can not be added to an existing class. \
+        The instances will not have ``__dict__`` unless it is provided by the base classes, while \
+        ``__weakref__`` is kept in the slots when the given class has it. A slot for the hash value cache \
+        of :func:`hasheq` with ``frozen=True`` is declared as well.
+
+    .. note::
+        Creating the new class runs ``__init_subclass__`` of the base classes and the hooks of the metaclass \
+        again, and the decorators applied before still refer to the given class, so :func:`constructor` with \
+        ``slots=True`` should be the innermost decorator (only :func:`asitems` can be applied before it).
+
     Examples::
         >>> @constructor(['x', ('y', 2)], '''
         >>>     Overview:
@@ -230,37 +393,38 @@ def constructor(params: Optional[Iterable] = None, doc: Optional[str] = None):
             items = _auto_get_items_from_cls(cls)
         else:
             items = params or []
-        actual_items = []
-        arg_items = []
+        arg_items, body_lines, field_names = [], [], []
         for it in items:
             if isinstance(it, str):
-                itn, itv = it, _NO_DEFAULT_VALUE
+                arg_items.append(it)
+                itn = it
             else:
                 itn, itv = it
+                arg_items.append(f'{itn}={itv!r}')
+            body_lines.append(f'{_INDENT}self.{_cls_prefix}{itn} = {itn}')
+            field_names.append(f'{_cls_prefix}{itn}')
+
+        if slots:
+            # the slot of the hash value cache is declared as well, which is used by hasheq(frozen=True)
+            if not hasattr(cls, _FROZEN_HASH_ATTR):
+                field_names.append(_FROZEN_HASH_ATTR)
+            cls = _slotted_class(cls, field_names)
+
+        _key = (tuple(arg_items), _cls_prefix)
+        _init_code = _INIT_CODE_CACHE.get(_key, None)
+        if _init_code is None:
+            _init_func_str = '\n'.join([
+                f"def __init__(self, {', '.join(arg_items)}):",
+                *(body_lines or [f'{_INDENT}pass']),
+            ])
+            _init_code = compile(_init_func_str, '<constructor>', 'exec')
+            _INIT_CODE_CACHE[_key] = _init_code
 
-            actual_items.append((itn, itv))
-            if itv is _NO_DEFAULT_VALUE:
-                arg_items.append(itn)
-            else:
-                arg_items.append(f'{itn}={repr(itv)}')
-
-        _init_func_str = f"""
-def __init__(self, {', '.join(arg_items)}):
-{os.linesep.join(f'{_INDENT}self.{_cls_prefix}{name} = {name}' for name, _ in actual_items)}
-        """
         fres = {}
-        exec(_init_func_str, fres)
+        exec(_init_code, fres)
 
         _init_func = fres['__init__']
-        _init_func = fassign(__doc__=doc or textwrap.dedent(f'''
-        Constructor of class {cls.__name__}.
-
-        .. note::
-            Created by {_PACKAGE_RST}, v{__VERSION__}.
-
-            The values of arguments supplied to this constructor \
-            will be put into the fields specified.
-        '''))(_init_func)
+        _init_func = fassign(__doc__=doc or _INIT_DOC.format(cls=cls.__name__))(_init_func)
         cls.__init__ = _init_func
 
         return cls
@@ -268,7 +432,58 @@ def __init__(self, {', '.join(arg_items)}):
     return _decorator
 
 
-def hasheq(items: Optional[Iterable] = None):
+_HASH_DOC = textwrap.dedent(f"""
+Hash value of class {{cls}}'s instances.
+
+.. note::
+    Created by {_PACKAGE_RST}, v{__VERSION__}.
+
+    The return value is calculated based on the \\
+    values of the internally specified fields.
+""")
+_EQ_DOC = textwrap.dedent(f"""
+Equality between class {{cls}}'s instances.
+
+.. note::
+    Created by {_PACKAGE_RST}, v{__VERSION__}.
+
+    Currently, the return value is True only if both objects \\
+    are of class {{cls}} (subclasses are not permitted) and the \\
+    values of the internally specified fields are all equal; \\
+    otherwise, it is always False.
+""")
+_NE_DOC = textwrap.dedent(f"""
+Non-equality between class {{cls}}'s instances.
+
+.. note::
+    Created by {_PACKAGE_RST}, v{__VERSION__}.
+
+    Currently, the return value is False only if both objects \\
+    are of class {{cls}} (subclasses are not permitted) and the \\
+    values of the internally specified fields are all equal; \\
+    otherwise, it is always True.
+""")
+
+
+# the hash value of a frozen instance is cached in this field of the instance itself
+_FROZEN_HASH_ATTR = '_hasheq_cached_hash'
+
+
+def _frozen_hash(func):
+    def __hash__(self):
+        value = getattr(self, _FROZEN_HASH_ATTR, None)
+        if value is None:
+            value = func(self)
+            try:
+                object.__setattr__(self, _FROZEN_HASH_ATTR, value)
+            except AttributeError:  # neither __dict__ nor the slot is present, so the hash value is not cached
+                pass
+        return value
+
+    return __hash__
+
+
+def hasheq(items: Optional[Iterable] = None, frozen: bool = False):
     """
     Overview:
         Decorate class to be visible by `repr`.
@@ -276,10 +491,18 @@ def hasheq(items: Optional[Iterable] = None):
     Arguments:
         - items (:obj:`Optional[Iterable]`): Items to be hashed and compared. Default is `None`, \
             which means automatically find the private fields and display them.
+        - frozen (:obj:`bool`): The fields will not be changed after creation, so the hash value of each \
+            instance is calculated only once. Default is `False`.
 
     Returns:
         - decorator: Decorator to decorate the given class.
 
+    .. note::
+        When ``frozen`` is `True`, the hash value will not be updated after the fields are changed, so please \
+        make sure the fields are not changed. The hash value is cached in the ``_hasheq_cached_hash`` field of \
+        the instance, whose slot is declared by :func:`constructor` with ``slots=True``. Instances without \
+        ``__dict__`` or this slot are hashed on every call.
+
     Examples::
         >>> @hasheq(['x', 'y'])
         >>> class T:
@@ -298,64 +521,85 @@ def hasheq(items: Optional[Iterable] = None):
 
     def _decorator(cls):
         _cls_prefix = _cls_private_prefix(cls)
-
-        def _get_items(self):
-            if items is None:
-                return _auto_get_items(self, _cls_prefix)
-            else:
-                return items
+        _cls_items = _auto_get_cls_items(cls, _cls_prefix)
 
         def _get_obj_values(self):
-            return tuple(_get_value(self, name, _cls_prefix) for name in _get_items(self))
-
-        def __hash__(self):
-            f"""
-            Hash value of class {cls.__name__}'s instances.
-
-            .. note::
-                Created by {_PACKAGE_RST}, v{__VERSION__}.
+            return tuple([
+                _get_value(self, name, _cls_prefix)
+                for name in _auto_get_items(self, _cls_prefix, _cls_items)
+            ])
 
-                The return value is calculated based on the \
-                values of the internally specified fields.
-            """
+        def _dynamic_hash(self):
             return hash(_get_obj_values(self))
 
-        def __eq__(self, other):
-            f"""
-            Equality between class {cls.__name__}'s instances.
-
-            .. note::
-                Created by {_PACKAGE_RST}, v{__VERSION__}.
-
-                Currently, the return value is True only if both objects \\
-                are of class {cls.__name__} (subclasses are not permitted) and the \\
-                values of the internally specified fields are all equal; \\
-                otherwise, it is always False.
-            """
+        def _dynamic_eq(self, other):
             if self is other:
                 return True
-            elif type(self) == type(other):
+            elif type(self) is type(other):
                 return _get_obj_values(self) == _get_obj_values(other)
             else:
                 return False
 
-        def __ne__(self, other):
-            f"""
-            Non-equality between class {cls.__name__}'s instances.
+        _items = _static_items(cls, items)
+        if _items is not None:
+            # the items are known now, so the fields are read and compared by the generated code
+            fres = {'_no_value': _NO_DEFAULT_VALUE, '_dynamic_hash': _dynamic_hash, '_dynamic_eq': _dynamic_eq}
+            if items is None:
+                # subclasses may redefine __items__, then the items should be found when called
+                fres['_cls_items_obj'] = cls.__items__
+                hash_guard = [
+                    f'{_INDENT}if type(self).__items__ is not _cls_items_obj:',
+                    f'{_INDENT * 2}return _dynamic_hash(self)',
+                ]
+                eq_guard = [
+                    f'{_INDENT}elif type(self).__items__ is not _cls_items_obj:',
+                    f'{_INDENT * 2}return _dynamic_eq(self, other)',
+                ]
+            else:
+                hash_guard, eq_guard = [], []
+
+            lines = ['def __hash__(self):', *hash_guard]
+            for i, name in enumerate(_items):
+                lines.extend(_value_code(f'_s{i}', 'self', name, _cls_prefix, _INDENT))
+            if len(_items) == 1:  # single field is hashed directly, without the tuple
+                lines.append(f'{_INDENT}return hash(_s0)')
+            else:
+                lines.append(f"{_INDENT}return hash(({''.join(f'_s{i}, ' for i in range(len(_items)))}))")
+
+            lines.extend([
+                'def __eq__(self, other):',
+                f'{_INDENT}if self is other:',
+                f'{_INDENT * 2}return True',
+                f'{_INDENT}elif type(self) is not type(other):',
+                f'{_INDENT * 2}return False',
+                *eq_guard,
+            ])
+            for i, name in enumerate(_items):
+                # compared like the items of tuples, and the rest fields will not be read once a pair differs
+                lines.extend(_value_code(f'_s{i}', 'self', name, _cls_prefix, _INDENT))
+                lines.extend(_value_code(f'_o{i}', 'other', name, _cls_prefix, _INDENT))
+                lines.extend([
+                    f'{_INDENT}if not (_s{i} is _o{i} or _s{i} == _o{i}):',
+                    f'{_INDENT * 2}return False',
+                ])
+            lines.append(f'{_INDENT}return True')
+
+            exec('\n'.join(lines), fres)
+            __hash__, __eq__ = fres['__hash__'], fres['__eq__']
 
-            .. note::
-                Created by {_PACKAGE_RST}, v{__VERSION__}.
+        else:
+            __hash__, __eq__ = _dynamic_hash, _dynamic_eq
 
-                Currently, the return value is False only if both objects \\
-                are of class {cls.__name__} (subclasses are not permitted) and the \\
-                values of the internally specified fields are all equal; \\
-                otherwise, it is always True.
-            """
-            return not __eq__(self, other)
+        if frozen:
+            __hash__ = _frozen_hash(__hash__)
+        cls.__hash__ = fassign(__doc__=_HASH_DOC.format(cls=cls.__name__))(__hash__)
+        cls.__eq__ = fassign(__doc__=_EQ_DOC.format(cls=cls.__name__))(__eq__)
+        if cls.__ne__ is not object.__ne__:
+            # object.__ne__ inverts __eq__ in C, so __ne__ is only defined when the default one is overridden
+            def __ne__(self, other):
+                return not __eq__(self, other)
 
-        cls.__hash__ = __hash__
-        cls.__eq__ = __eq__
-        cls.__ne__ = __ne__
+            cls.__ne__ = fassign(__doc__=_NE_DOC.format(cls=cls.__name__))(__ne__)
 
         return cls
 
@@ -364,17 +608,30 @@ def hasheq(items: Optional[Iterable] = None):
 
 _READONLY_MARKS = {'r', 'ro', 'readonly'}
 _WRITABLE_MARKS = {'w', 'rw', 'writable'}
+_WRITABLE_OF_MARKS = {
+    **{mark: False for mark in _READONLY_MARKS},
+    **{mark: True for mark in _WRITABLE_MARKS},
+}
 
 
 def _is_writable(mark: str):
-    if mark.lower() in _READONLY_MARKS:
-        return False
-    elif mark.lower() in _WRITABLE_MARKS:
-        return True
-    else:
+    try:
+        return _WRITABLE_OF_MARKS[mark.lower()]
+    except KeyError:
         raise ValueError(f'Unknown accessible mark - {repr(mark)}.')
 
 
+_ACCESSOR_DOC = textwrap.dedent(f"""
+Property {{name}}.
+
+.. note::
+    Created by {_PACKAGE_RST}, v{__VERSION__}.
+
+    {{mode}} \\
+    permitted with the accessor ``{{name}}``.
+""")
+
+
 def accessor(items: Optional[Iterable] = None, readonly: bool = False):
     """
     Overview:
@@ -422,37 +679,23 @@ def accessor(items: Optional[Iterable] = None, readonly: bool = False):
             itv = _is_writable(itv)
             pitems.append((itn, itv))
 
+        # all the setters are generated and compiled together
+        _setter_func_str = '\n'.join(
+            f'def set_{itn}(self, new_value):\n{_INDENT}self.{_cls_prefix}{itn} = new_value'
+            for itn, itv in pitems if itv
+        )
+        fres = {}
+        exec(_setter_func_str, fres)
+
+        properties = {}
         for itn, itv in pitems:
-            _getter_func_str = f"""
-def get_{itn}(self):
-{_INDENT}return self.{_cls_prefix}{itn}
-            """
-            fres = {}
-            exec(_getter_func_str, fres)
-            getter_func = fres[f'get_{itn}']
-            getter_func = fassign(__doc__=f"""
-            Property {itn}.
-
-            .. note::
-                Created by {_PACKAGE_RST}, v{__VERSION__}.
-
-                {'Both reading and writing are' if itv else 'Only reading is'} \\
-                permitted with the accessor ``{itn}``.
-            """)(getter_func)
-
-            if itv:
-                _setter_func_str = f"""
-def set_{itn}(self, new_value):
-{_INDENT}self.{_cls_prefix}{itn} = new_value
-                """
-                fres = {}
-                exec(_setter_func_str, fres)
-                setter_func = fres[f'set_{itn}']
-
-                p = property(getter_func, setter_func)
-            else:
-                p = property(getter_func)
+            # attrgetter is implemented in C, so no python frame is created when reading the property
+            getter_func = operator.attrgetter(_cls_prefix + itn)
+            setter_func = fres[f'set_{itn}'] if itv else None
+            doc = _ACCESSOR_DOC.format(name=itn, mode='Both reading and writing are' if itv else 'Only reading is')
+            properties[itn] = property(getter_func, setter_func, doc=doc)
 
+        for itn, p in properties.items():
             setattr(cls, itn, p)
 
         return cls
@@ -2,10 +2,11 @@
 Overview:
     Base interface to quickly implement a comparable object.
 """
-import operator as ops
+from typing import Iterable, List, TypeVar
 
 __all__ = [
     'IComparable',
+    'comparable_sort',
 ]
 
 
@@ -49,31 +50,80 @@ class IComparable:
         raise NotImplementedError  # pragma: no cover
 
     def _cmpcheck(self, op, other, default=False):
-        if type(self) == type(other):
+        # not used by the methods below, but kept for the subclasses which call it
+        if type(self) is type(other):
             return op(self._cmpkey(), other._cmpkey())
         else:
             return default
 
+    # the comparison methods are written out instead of calling _cmpcheck, to save one python frame per comparison
     def __eq__(self, other):
         if self is other:
             return True
+        elif type(self) is type(other):
+            return self._cmpkey() == other._cmpkey()
         else:
-            return self._cmpcheck(ops.__eq__, other, default=False)
-
-    def __ne__(self, other):
-        if self is other:
             return False
-        else:
-            return self._cmpcheck(ops.__ne__, other, default=True)
 
     def __lt__(self, other):
-        return self._cmpcheck(ops.__lt__, other)
+        if type(self) is type(other):
+            return self._cmpkey() < other._cmpkey()
+        else:
+            return False
 
     def __le__(self, other):
-        return self._cmpcheck(ops.__le__, other)
+        if type(self) is type(other):
+            return self._cmpkey() <= other._cmpkey()
+        else:
+            return False
 
     def __gt__(self, other):
-        return self._cmpcheck(ops.__gt__, other)
+        if type(self) is type(other):
+            return self._cmpkey() > other._cmpkey()
+        else:
+            return False
 
     def __ge__(self, other):
-        return self._cmpcheck(ops.__ge__, other)
+        if type(self) is type(other):
+            return self._cmpkey() >= other._cmpkey()
+        else:
+            return False
+
+
+_ComparableType = TypeVar('_ComparableType', bound=IComparable)
+
+
+def comparable_sort(items: Iterable[_ComparableType], reverse: bool = False) -> List[_ComparableType]:
+    """
+    Overview:
+        Sort the :class:`IComparable` objects by their keys.
+
+    :param items: Objects to be sorted, they should be of the same type.
+    :param reverse: Sort in descending order, default is ``False``.
+    :return: Sorted list, which is the same as ``sorted(items, reverse=reverse)``.
+
+    .. note::
+        The key of each object is got only once, and the keys are compared directly, so this is faster than \
+        ``sorted(items)`` which calls the comparison methods of :class:`IComparable` about ``N * log(N)`` times.
+
+    Examples::
+        >>> from hbutils.model import IComparable, comparable_sort
+        >>> class MyValue(IComparable):
+        ...     def __init__(self, v) -> None:
+        ...         self.v = v
+        ...
+        ...     def _cmpkey(self):
+        ...         return self.v
+        ...
+        >>> [x.v for x in comparable_sort([MyValue(2), MyValue(3), MyValue(1)])]
+        [1, 2, 3]
+        >>> [x.v for x in comparable_sort([MyValue(2), MyValue(3), MyValue(1)], reverse=True)]
+        [3, 2, 1]
+    """
+    items = list(items)
+    types = {type(item) for item in items}
+    if len(types) > 1:
+        raise TypeError(f'Items should be of the same type, but {len(types)} types found.')
+
+    # noinspection PyProtectedMember
+    return sorted(items, key=lambda x: x._cmpkey(), reverse=reverse)
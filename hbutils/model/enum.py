@@ -3,7 +3,6 @@ Overview:
     Useful utilities for python enum class.
 """
 from enum import IntEnum, unique
-from functools import lru_cache
 from types import MethodType
 from typing import Type, Optional, Callable, TypeVar, Any
 
@@ -147,27 +146,37 @@ def int_enum_loads(enable_int: bool = True, value_preprocess: Optional[Callable[
             raise TypeError('Int enum expected but {type} found.'.format(type=repr(enum_class.__name__)))
         enum_class = unique(enum_class)
 
-        @lru_cache()
-        def _dict_item():
-            return {key: value for key, value in enum_class.__members__.items()}
-
-        @lru_cache()
-        def _int_value_to_item():
-            return {value.value: value for _, value in _dict_item().items()}
-
-        @lru_cache()
-        def _str_name_to_item():
-            return {name_preprocess(key): value for key, value in _dict_item().items()}
+        # members of enum class will not be changed, so the lookup tables are built only once
+        _int_value_to_item = {value.value: value for value in enum_class.__members__.values()}
+        _str_name_to_item = {name_preprocess(key): value for key, value in enum_class.__members__.items()}
+        _external_process = external_process or _get_default_external_preprocess(enum_class)
+
+        # bound methods of dict are used directly when there is no preprocessor, so no python frame is created
+        if value_preprocess is _default_value_preprocess:
+            _load_int = _int_value_to_item.__getitem__
+        else:
+            def _load_int(data):
+                return _int_value_to_item[value_preprocess(data)]
+        if name_preprocess is _default_name_preprocess:
+            _load_str = _str_name_to_item.__getitem__
+        else:
+            def _load_str(data):
+                return _str_name_to_item[name_preprocess(data)]
 
         def _load_func(data) -> Optional[enum_class]:
-            if isinstance(data, enum_class):
+            _type = type(data)
+            if _type is int and enable_int:  # exact int and str are the most common, so check them first
+                return _load_int(data)
+            elif _type is str and enable_str:
+                return _load_str(data)
+            elif isinstance(data, enum_class):
                 return data
             elif enable_int and isinstance(data, int):
-                return _int_value_to_item()[value_preprocess(data)]
+                return _load_int(data)
             elif enable_str and isinstance(data, str):
-                return _str_name_to_item()[name_preprocess(data)]
+                return _load_str(data)
             else:
-                return (external_process or _get_default_external_preprocess(enum_class))(data)
+                return _external_process(data)
 
         def loads(cls, data) -> Optional[enum_class]:
             """
@@ -7,6 +7,14 @@ __all__ = [
 ]
 
 
+def _bulk_bytes(rnd: random.Random, length: int) -> bytes:
+    # all the bytes are generated with one call, Random.randbytes is not used because it is not provided in python3.8
+    if length <= 0:
+        return b''
+    else:
+        return rnd.getrandbits(length * 8).to_bytes(length, 'little')
+
+
 def random_bytes(length: int = 32, allow_zero: bool = False, rnd: Optional[random.Random] = None) -> bytes:
     r"""
     Overview:
@@ -29,11 +37,19 @@ def random_bytes(length: int = 32, allow_zero: bool = False, rnd: Optional[rando
         b"i7\x98\xd5\x81\x1d\xdb\xd8\xe1^\xf2\xe4\xbf\xe0O^\xeb\xed\xb0i\xaa\xf3\x16Jx\xf7J\xd7\xae1\x81\xc6\xad\xd21\x15\x8aX\xb6\xc7\x85\xa4\x1c{\xac^6\xdf\x03\x94kR}\x91\x96\xfe\x06{'I\xed5\x03r"
     """
     rnd = rnd or _DEFAULT_RANDOM
-    bits = []
-    for i in range(length):
-        if allow_zero:
-            bits.append(rnd.randint(0, 0xff))
-        else:
-            bits.append(rnd.randint(1, 0xff))
-
-    return bytes(bits)
+    result = _bulk_bytes(rnd, length)
+    if allow_zero or 0 not in result:
+        return result
+
+    # zero bytes are redrawn in batches until no zero is left, the values are still uniform in [1, 0xff]
+    buffer = bytearray(result)
+    zeros, i = [], result.find(0)
+    while i >= 0:  # find is used to scan the bytes in C, only zero bytes are visited in python
+        zeros.append(i)
+        i = result.find(0, i + 1)
+    while zeros:
+        for i, b in zip(zeros, _bulk_bytes(rnd, len(zeros))):
+            buffer[i] = b
+        zeros = [i for i in zeros if not buffer[i]]
+
+    return bytes(buffer)
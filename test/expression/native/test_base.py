@@ -63,3 +63,8 @@ class TestExpressionNativeBaseClass:
         assert f3(1) == 2
         assert f3(2) == 3
         assert f3(3) == 4
+
+    def test_slots(self):
+        e = self.__expcls__(lambda x: x)
+        with pytest.raises(AttributeError):
+            e.some_attribute = 1
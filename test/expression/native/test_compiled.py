@@ -0,0 +1,71 @@
+import pytest
+from easydict import EasyDict
+
+from hbutils.expression import keep, expr, raw, efunc, cfunc, BitwiseExpression
+
+
+@pytest.mark.unittest
+class TestExpressionNativeCompiled:
+    def test_cfunc(self):
+        e = keep()
+        for ex in [
+            e, 1, raw([1, 2]), (e + 1) * e, -(e ** 2) // 3 + (e > 2) - +e / 2,
+            (e > 1) & (e < 5), ~(e == 2) | (e % 2 == 0), (e != 3) * 2 >= 1, e <= 2,
+        ]:
+            f1, f2 = efunc(ex), cfunc(ex)
+            for v in range(1, 10):
+                assert f1(v) == f2(v)
+
+        b = keep(BitwiseExpression)
+        for ex in [(b & 6) | (b ^ 1), (b << 2) >> 1, ~b]:
+            f1, f2 = efunc(ex), cfunc(ex)
+            for v in range(-5, 10):
+                assert f1(v) == f2(v)
+
+    def test_cfunc_opaque(self):
+        e = keep()
+        f = cfunc(e.a[0] + e.b.upper() * 2 + e.c(3, y=e.n))
+        assert f(EasyDict(a=['x'], b='yz', c=lambda x, y: str(x + y), n=4)) == 'xYZYZ7'
+
+        f = cfunc(e.upper()[::-1])
+        assert f('abc') == 'CBA'
+
+    def test_cfunc_shared_node(self):
+        cnt = 0
+
+        def _leaf(x):
+            nonlocal cnt
+            cnt += 1
+            return x + 1
+
+        e = expr(_leaf)
+        f = cfunc((e * e) + (e * e) + 1)
+        assert f(2) == 19
+        assert cnt == 1
+        assert f(3) == 33
+        assert cnt == 2
+
+    def test_cfunc_short_circuit(self):
+        cnt = 0
+
+        def _leaf(x):
+            nonlocal cnt
+            cnt += 1
+            return x + 1
+
+        e = expr(_leaf)
+        f = cfunc(((e > 2) & (e * 2 > 7)) | (e * 2 > 3))
+        assert f(0) is False
+        assert cnt == 1
+        assert f(2) is True
+        assert cnt == 2
+        assert f(4) is True
+        assert cnt == 3
+
+        cnt = 0
+        s = e * 2
+        f = cfunc(((e > 2) & (s > 7)) | (s > 3))
+        assert f(0) is False
+        assert f(2) is True
+        assert f(3) is True
+        assert cnt == 3
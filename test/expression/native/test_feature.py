@@ -275,6 +275,27 @@ class TestExpressionNativeLogicalClass(TestExpressionNativeBaseClass):
         assert f1(4) is True
         assert f1(5) is False
 
+    def test_logical_short_circuit(self):
+        def _error(x):
+            raise ValueError(x)
+
+        e1 = self.__expcls__(lambda x: x > 1)
+        e2 = self.__expcls__(_error)
+        f1 = efunc(e1 & e2)
+        assert f1(0) is False
+        with pytest.raises(ValueError):
+            f1(2)
+
+        f2 = efunc(e1 | e2)
+        assert f2(2) is True
+        with pytest.raises(ValueError):
+            f2(0)
+
+        f3 = efunc(0 & e2)
+        assert f3(1) == 0
+        f4 = efunc('s' | e2)
+        assert f4(1) == 's'
+
 
 @pytest.mark.unittest
 class TestExpressionNativeMathClass(TestExpressionNativeBaseClass):
@@ -615,6 +636,35 @@ class TestExpressionNativeMathClass(TestExpressionNativeBaseClass):
         assert f1(1) == -2
         assert f1(2) == -3
 
+    def test_math_chain(self):
+        e = self.__expcls__(lambda x: x)
+        e1 = e + 'b' + (lambda x: x * 2) + 'c'
+        assert len(getattr(e1, '_args')) == 4
+        f1 = efunc(e1)
+        assert f1('a') == 'abaac'
+        assert f1('x') == 'xbxxc'
+
+        e2 = 'a' + e + 'b'
+        assert len(getattr(e2, '_args')) == 3
+        f2 = efunc(e2)
+        assert f2('x') == 'axb'
+
+        e3 = e * 2 * e * 3
+        assert len(getattr(e3, '_args')) == 4
+        f3 = efunc(e3)
+        assert f3(1) == 6
+        assert f3(2) == 24
+
+        e4 = e + (e + 1)
+        assert len(getattr(e4, '_args')) == 2
+        assert efunc(e4)(2) == 5
+
+        e5 = e
+        for i in range(100):
+            e5 = e5 + i
+        assert len(getattr(e5, '_args')) <= 32
+        assert efunc(e5)(2) == 2 + sum(range(100))
+
 
 @pytest.mark.unittest
 class TestExpressionNativeBitwiseClass(TestExpressionNativeBaseClass):
@@ -1,6 +1,6 @@
 import pytest
 
-from hbutils.expression import GeneralExpression, expr, efunc, keep, CheckExpression, raw
+from hbutils.expression import GeneralExpression, expr, efunc, keep, CheckExpression, raw, MathExpression, linearize
 from .test_feature import TestExpressionNativeComparableClass, TestExpressionNativeIndexedClass, \
     TestExpressionNativeObjectClass, TestExpressionNativeLogicalClass, TestExpressionNativeMathClass
 
@@ -79,3 +79,85 @@ class TestExpressionNativeGeneral:
         assert f(1) is _my_func
         assert f(2) is _my_func
         assert f(3) is _my_func
+
+    def test_const_folding(self):
+        e = raw(2) + 3
+        assert getattr(e, '_const') == (5,)
+        assert isinstance(e, GeneralExpression)
+        assert efunc(e)(1) == 5
+
+        e = (raw(2) * 3 - 1) ** 2 > expr(20)
+        assert getattr(e, '_const') == (True,)
+        assert efunc(e)(1) is True
+
+        e = raw('abc')[1] + 'd'
+        assert getattr(e, '_const') == ('bd',)
+
+        e = keep() + 1 + 2
+        assert getattr(e, '_const') is None
+        assert efunc(e)(1) == 4
+
+    def test_const_folding_skipped(self):
+        e = raw(1) / 0
+        assert getattr(e, '_const') is None
+        f = efunc(e)
+        with pytest.raises(ZeroDivisionError):
+            f(1)
+
+        lst = [1]
+        e = raw(lst) + [2]
+        assert getattr(e, '_const') is None
+        lst.append(3)
+        assert efunc(e)(1) == [1, 3, 2]
+
+        e = raw(str.upper)('abc')
+        assert getattr(e, '_const') is None
+        assert efunc(e)(1) == 'ABC'
+
+    def test_const_folding_limited(self):
+        e = raw(2) ** raw(10 ** 10)  # too large to be pre-calculated
+        assert getattr(e, '_const') is None
+
+        e = raw(10) ** 1000
+        assert getattr(e, '_const') is None
+        assert efunc(e)(1) == 10 ** 1000
+        assert getattr(raw(10) ** 20, '_const') == (10 ** 20,)
+
+        e = raw('a') * 10 ** 8
+        assert getattr(e, '_const') is None
+        assert getattr(raw('ab') * 3, '_const') == ('ababab',)
+        assert getattr(raw(2) * 3 * 'ab', '_const') == ('ab' * 6,)
+
+        e = raw(2) * 3 * (raw('a') * 10)
+        assert getattr(e, '_const') == ('a' * 60,)
+        e = raw(2 ** 100) * (2 ** 100)
+        assert getattr(e, '_const') is None
+        assert efunc(e)(1) == 2 ** 200
+
+        e = raw('%08d') % 1
+        assert getattr(e, '_const') is None
+        assert efunc(e)(1) == '00000001'
+
+    def test_interning(self):
+        e = keep()
+        assert (e * 2) is (e * 2)
+        assert (e * 2 + 1) is (e * 2 + 1)
+        assert (e + 1) is not (e + 1.0)
+        assert (e + 0.0) is not (e + -0.0)
+        assert (e + 1) is not (expr(lambda x: x) + 1)
+        assert (expr(e, MathExpression) + 1) is (e + 1)
+        assert (MathExpression() + 1) is not (MathExpression() + 1)
+
+        lst = [1]
+        assert (e + raw(lst)) is not (e + raw(lst))
+        assert e.upper is not e.upper
+
+        ops, _ = linearize((e * e) + (e * e))
+        assert len(ops) == 3
+
+    def test_expr_fast_path(self):
+        e = keep()
+        assert e is keep()
+        assert keep(CheckExpression) is not keep(CheckExpression)
+        assert expr(e) is e
+        assert expr(e, CheckExpression) is e
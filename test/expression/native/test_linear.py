@@ -0,0 +1,48 @@
+import pytest
+from easydict import EasyDict
+
+from hbutils.expression import keep, expr, efunc, lfunc, linearize
+
+
+@pytest.mark.unittest
+class TestExpressionNativeLinear:
+    def test_linearize(self):
+        e = keep()
+        ops, operands = linearize((e + 1) * e)
+        assert len(ops) == 4
+        assert operands == [(-1,), (-1,), (0, 1), (2, 0)]
+        assert ops[0](2) == 2
+        assert ops[1](2) == 1
+
+        ops, operands = linearize(1)
+        assert len(ops) == 1
+        assert operands == [(-1,)]
+        assert ops[0](2) == 1
+
+    def test_lfunc(self):
+        e = keep()
+        for ex in [
+            e, 1, (e + 1) * e, -(e ** 2) // 3 + (e > 2),
+            (e > 1) & (e < 5), ~(e == 2) | (e % 2 == 0),
+        ]:
+            f1, f2 = efunc(ex), lfunc(ex)
+            for v in range(-5, 10):
+                assert f1(v) == f2(v)
+
+    def test_lfunc_opaque(self):
+        e = keep()
+        f = lfunc(e.a[0] + e.b.upper() * 2 + e.c(3, y=4))
+        assert f(EasyDict(a=['x'], b='yz', c=lambda x, y: str(x + y))) == 'xYZYZ7'
+
+    def test_lfunc_shared_node(self):
+        cnt = 0
+
+        def _leaf(x):
+            nonlocal cnt
+            cnt += 1
+            return x + 1
+
+        e = expr(_leaf)
+        f = lfunc((e * e) + (e * 2))
+        assert f(2) == 15
+        assert cnt == 1
@@ -0,0 +1,103 @@
+from unittest import skipUnless
+from unittest.mock import patch
+
+import pytest
+
+from hbutils.expression import keep, raw, efunc, vfunc, expr, BitwiseExpression
+from hbutils.testing import vpip
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@pytest.mark.unittest
+class TestExpressionNativeVector:
+    def test_vfunc_simple(self):
+        e = keep()
+        f = vfunc(e * 2 + e ** 2 - 1)
+        assert f(1) == 2
+        assert f(2) == 7
+        assert f(3) == 14
+
+        assert vfunc(1)(2) == 1
+        assert vfunc(e)(2) == 2
+        assert vfunc(-e + 1)(2) == -1
+        assert vfunc(~(e < 2))(3) is True
+        assert vfunc((e // 2) % 3)(8) == 1
+
+        b = keep(BitwiseExpression)
+        assert vfunc((b & 6) | (b ^ 1))(5) == 4
+        assert vfunc((b << 2) >> 1)(3) == 6
+        assert vfunc(~b)(3) == -4
+
+    def test_vfunc_opaque(self):
+        e = keep()
+        f = vfunc(e['a'] + e['b'] * 2)
+        assert f({'a': 1, 'b': 2}) == 5
+        assert f({'a': 3, 'b': -1}) == 1
+
+        f = vfunc(e.upper() + raw('_') + e)
+        assert f('str') == 'STR_str'
+
+    def test_vfunc_shared_node(self):
+        cnt = 0
+
+        def _leaf(x):
+            nonlocal cnt
+            cnt += 1
+            return x + 1
+
+        e = expr(_leaf)
+        f = vfunc(e * e + e)
+        assert f(2) == 12
+        assert cnt == 1
+        assert efunc(e * e + e)(2) == 12
+        assert cnt == 4
+
+    @skipUnless(vpip('numpy'), 'numpy required')
+    def test_vfunc_numpy(self):
+        e = keep()
+        for ex in [e * 2 + e ** 2 - 1, (e > 2) == (e < 5), (e + 1) / 2, (e // 2) % 3]:
+            arr = np.arange(-5, 10)
+            assert np.array_equal(vfunc(ex)(arr), efunc(ex)(arr))
+
+    @skipUnless(vpip('numpy'), 'numpy required')
+    def test_vfunc_numpy_without_numexpr(self):
+        e = keep()
+        with patch('hbutils.expression.native.vector.numexpr', None):
+            for ex in [e * 2 + e ** 2 - 1, (e > 2) == (e < 5), (e + 1) / 2, (e // 2) % 3]:
+                arr = np.arange(-5, 10)
+                assert np.array_equal(vfunc(ex)(arr), efunc(ex)(arr))
+
+    @skipUnless(vpip('numpy'), 'numpy required')
+    def test_vfunc_numpy_dtypes(self):
+        e = keep()
+        f = vfunc(e * 100)
+        for arr in [np.array([100, 2], dtype=np.int8), np.array([3, 4], dtype=np.uint8),
+                    np.array([1.5, 2.0], dtype=np.float32), np.array([1.5, 2.0]),
+                    np.array([1, 'x'], dtype=object)]:
+            result, expected = f(arr), efunc(e * 100)(arr)
+            assert result.dtype == expected.dtype
+            assert np.array_equal(result, expected)
+
+        with pytest.raises(ValueError):
+            vfunc(e ** -1)(np.array([1, 2]))
+        assert np.array_equal(vfunc(e ** -1)(np.array([1.0, 2.0])), np.array([1.0, 0.5]))
+        assert np.array_equal(vfunc(e < 'b')(np.array(['a', 'c'])), np.array([True, False]))
+
+    @skipUnless(vpip('numpy') and vpip('numexpr'), 'numpy and numexpr required')
+    def test_vfunc_numexpr_used(self):
+        import numexpr
+
+        e = keep()
+        arr = np.arange(-5, 10, dtype=np.float64)
+        with patch.object(numexpr, 'evaluate', wraps=numexpr.evaluate) as mock_evaluate:
+            f = vfunc(e * 2 + e ** 2 - 1)
+            assert np.array_equal(f(arr), efunc(e * 2 + e ** 2 - 1)(arr))
+
+        mock_evaluate.assert_called_once()
+        (source,), kwargs = mock_evaluate.call_args
+        assert source == '(((v0 * v1) + (v0 ** v2)) - v3)'
+        assert kwargs['local_dict']['v0'] is arr
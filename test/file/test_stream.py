@@ -26,6 +26,22 @@ class TestFileFile:
             with keep_cursor(file):
                 assert file.read() == b'\x56\x78'
 
+    def test_keep_cursor_reuse(self):
+        with io.BytesIO(b'\x12\x34\x56\x78') as file:
+            kc = keep_cursor(file)
+            with kc:
+                assert file.read(3) == b'\x12\x34\x56'
+                with pytest.raises(RuntimeError):
+                    with kc:
+                        pass  # pragma: no cover
+                assert file.tell() == 3
+            assert file.tell() == 0
+
+            _ = file.read(1)
+            with kc:  # can be used again after exited
+                assert file.read() == b'\x34\x56\x78'
+            assert file.tell() == 1
+
     def test_getsize_bytesio(self):
         with io.BytesIO() as file:
             assert getsize(file) == 0
@@ -39,6 +55,11 @@ class TestFileFile:
             assert getsize(file) == 4
             assert file.tell() == 2
 
+            file.seek(0, io.SEEK_END)
+            file.write(b'\x9a')  # buffer should be released
+            assert getsize(file) == 5
+            assert file.tell() == 5
+
     def test_getsize_stringio(self):
         with io.StringIO() as file:
             assert getsize(file) == 0
@@ -76,6 +97,58 @@ class TestFileFile:
                 assert getsize(file) == 4
                 assert file.tell() == 2
 
+    def test_getsize_cache(self):
+        with isolated_directory():
+            pathlib.Path('binfile').write_bytes(b'\x12\x34\x56\x78')
+            with open('binfile', 'rb') as file:
+                assert getsize(file) == 4
+                with open('binfile', 'ab') as wfile:
+                    wfile.write(b'\x9a')
+
+                assert getsize(file) == 4
+                assert getsize(file, fresh=True) == 5
+                assert getsize(file) == 5
+
+            with open('binfile', 'rb+') as file:
+                assert getsize(file) == 5
+                file.seek(0, io.SEEK_END)
+                file.write(b'\xbc')
+                file.flush()
+                assert getsize(file) == 6
+
+        with isolated_directory():
+            pathlib.Path('strfile').write_text('abcd')
+            with open('strfile', 'r') as file:
+                assert file.read() == 'abcd'
+                assert is_eof(file)
+                with open('strfile', 'a') as wfile:
+                    wfile.write('e')
+
+                assert is_eof(file)
+                assert not is_eof(file, fresh=True)
+                assert file.read() == 'e'
+                assert is_eof(file)
+
+    def test_getsize_not_weak_referable(self):
+        class _Stream:
+            __slots__ = ('_file',)
+
+            def __init__(self, file):
+                self._file = file
+
+            def __getattr__(self, item):
+                return getattr(self._file, item)
+
+        with isolated_directory():
+            pathlib.Path('binfile').write_bytes(b'\x12\x34\x56\x78')
+            with open('binfile', 'rb') as file:
+                stream = _Stream(file)
+                assert getsize(stream) == 4
+                assert getsize(stream) == 4
+                with open('binfile', 'ab') as wfile:
+                    wfile.write(b'\x9a')
+                assert getsize(stream) == 5
+
     def test_is_eof_io(self):
         with io.BytesIO() as file:
             assert is_eof(file)
@@ -90,6 +163,10 @@ class TestFileFile:
             assert file.read(1) == b'\x78'
             assert is_eof(file)
 
+            file.write(b'\x9a')  # buffer should be released
+            assert is_eof(file)
+            assert file.getvalue() == b'\x12\x34\x56\x78\x9a'
+
         with io.StringIO() as file:
             assert is_eof(file)
 
@@ -117,6 +194,21 @@ class TestFileFile:
                 _ = file.read(1)
                 assert is_eof(file)
 
+            with open('binfile', 'rb+') as file:
+                _ = file.read(2)
+                assert not is_eof(file)
+                assert file.tell() == 2
+
+                _ = file.read(2)
+                assert is_eof(file)
+                assert file.tell() == 4
+
+                file.write(b'\x9a')
+                assert is_eof(file)
+                file.seek(-1, io.SEEK_END)
+                assert not is_eof(file)
+                assert file.read() == b'\x9a'
+
         with isolated_directory():
             pathlib.Path('strfile').write_text('abcd')
 
@@ -129,3 +221,21 @@ class TestFileFile:
 
                 _ = file.read(1)
                 assert is_eof(file)
+
+    def test_is_eof_beyond_end(self):
+        with io.BytesIO(b'\x12\x34\x56\x78') as file:
+            file.seek(6)
+            assert not is_eof(file)
+
+        with isolated_directory():
+            pathlib.Path('binfile').write_bytes(b'\x12\x34\x56\x78')
+            with open('binfile', 'rb') as file:
+                file.seek(6)
+                assert not is_eof(file)
+                file.seek(4)
+                assert is_eof(file)
+
+            pathlib.Path('strfile').write_text('abcd')
+            with open('strfile', 'r') as file:
+                file.seek(6)
+                assert not is_eof(file)
@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 from hbutils.model import visual, constructor, asitems, hasheq, accessor, get_field
@@ -76,6 +78,22 @@ class TestModelClazz:
 
         assert repr(T5(True, False)) == '<T5 x: yes>'
 
+        calls = []
+
+        def _display_ox_3(v):
+            calls.append(v)
+            return _display_ox_2(v)
+
+        @visual([('x', _display_ox_3), ('y', _display_ox_3), ('z', _display_ox_3)])
+        class T7:
+            def __init__(self, x, y, z):
+                self.__x = x
+                self.__y = y
+                self.__z = z
+
+        assert repr(T7(1, 2, 0)) == '<T7 x: yes, y: yes>'
+        assert calls == [1, 2, 0]
+
         @visual()
         @asitems(['x'])
         class T6:
@@ -137,6 +155,113 @@ class TestModelClazz:
 
         assert T2.__init__.__doc__ == "This is constructor of T."
 
+    def test_constructor_code_cache(self):
+        @constructor(['x', ('y', 2)])
+        class T:
+            pass
+
+        @constructor(['x', ('y', 2)])
+        class T1:
+            pass
+
+        @constructor(['x', ('y', 3)])
+        class T2:
+            pass
+
+        assert T.__init__ is not T1.__init__
+        assert T.__init__.__code__ is not T1.__init__.__code__  # different private prefix
+
+        t, t2 = T(1), T2(1)
+        assert (get_field(t, '__x'), get_field(t, '__y')) == (1, 2)
+        assert (get_field(t2, '__x'), get_field(t2, '__y')) == (1, 3)
+
+        def _make():
+            @constructor(['x', ('y', 2)])
+            class T:
+                pass
+
+            return T
+
+        assert _make().__init__.__code__ is T.__init__.__code__
+        assert _make().__init__ is not T.__init__
+
+        @constructor([])
+        class T3:
+            pass
+
+        T3()
+        with pytest.raises(TypeError):
+            T3(1)
+
+    def test_constructor_slots(self):
+        @hasheq()
+        @visual()
+        @constructor(slots=True)
+        @asitems(['x', 'y'])
+        class T:
+            """T's doc"""
+
+            @property
+            def sum(self):
+                return self.__x + self.__y
+
+        t = T(1, 2)
+        assert t.sum == 3
+        assert repr(t) == '<T x: 1, y: 2>'
+        assert t == T(1, 2)
+        assert T.__slots__ == ('_T__x', '_T__y', '_hasheq_cached_hash', '__weakref__')
+        assert T.__doc__ == "T's doc"
+        assert T.__qualname__.endswith('test_constructor_slots.<locals>.T')
+        assert not hasattr(t, '__dict__')
+        with pytest.raises(AttributeError):
+            t.z = 3
+
+        with pytest.raises(TypeError):
+            @constructor(['x'], slots=True)
+            class T1:
+                __slots__ = ('_T1__x',)
+
+        class TBase:
+            def value(self):
+                return 1
+
+        @constructor(['x'], slots=True)
+        class T2(TBase):
+            _T2__x = 0
+
+            def value(self):
+                return super().value() + self.__x
+
+            @property
+            def double(self):
+                return super().value() * 2 + self.__x
+
+        t = T2(2)
+        assert t.value() == 3
+        assert t.double == 4
+        assert T2.__slots__ == ('_T2__x', '_hasheq_cached_hash')  # __weakref__ is provided by TBase
+        assert weakref.ref(t)() is t
+
+    def test_constructor_slots_frozen(self):
+        @hasheq(frozen=True)
+        @constructor(slots=True)
+        @asitems(['x'])
+        class T:
+            pass
+
+        t = T(1)
+        assert not hasattr(t, '_hasheq_cached_hash')
+        assert hash(t) == hash(1)
+        assert t._hasheq_cached_hash == hash(1)
+        assert hash(t) == hash(1)
+        assert not hasattr(t, '__dict__')
+
+        @constructor(['y'], slots=True)
+        class T1(T):
+            pass
+
+        assert T1.__slots__ == ('_T1__y',)  # cache slot is provided by T
+
     # noinspection PyComparisonWithNone
     def test_hasheq(self):
         @hasheq(['x', 'y'])
@@ -166,6 +291,201 @@ class TestModelClazz:
         assert hash(t) == hash(T1(1, 2))
         assert hash(t) != hash(T1(10, 20))
         assert t != None
+        assert T1.__ne__ is object.__ne__
+        assert not (t != T1(1, 2))
+
+        class _Base:
+            def __ne__(self, other):
+                return 'base'
+
+        @hasheq(['x'])
+        class T2(_Base):
+            def __init__(self, x):
+                self.__x = x
+
+        assert T2.__ne__ is not _Base.__ne__
+        assert (T2(1) != T2(1)) is False
+        assert (T2(1) != T2(2)) is True
+        assert 'Non-equality' in T2.__ne__.__doc__
+
+    # noinspection PyComparisonWithNone
+    def test_generated_methods(self):
+        @hasheq(['x', 'y'])
+        @visual(['x', 'y'])
+        class T:
+            def __init__(self, x, y):
+                self.__x = x
+                self.__first = y
+
+            @property
+            def y(self):
+                return self.__first
+
+        t = T(1, 2)
+        assert repr(t) == '<T x: 1, y: 2>'
+        assert t == T(1, 2)
+        assert t != T(1, 3)
+        assert hash(t) == hash((1, 2))
+        assert 'Created by' in T.__repr__.__doc__
+        assert 'Created by' in T.__hash__.__doc__
+
+        @hasheq([])
+        @visual([])
+        class T1:
+            pass
+
+        assert repr(T1()) == '<T1>'
+        assert T1() == T1()
+        assert hash(T1()) == hash(())
+
+        nan = float('nan')
+
+        @hasheq()
+        @visual(show_id=True)
+        @asitems(['x', 'class'])
+        class T2:
+            def __init__(self, x, y):
+                self.__x = x
+                setattr(self, 'class', y)
+
+        t = T2(nan, 'a')
+        assert repr(t) == f'<T2 {hex(id(t))} x: nan, class: \'a\'>'
+        assert t == T2(nan, 'a')
+        assert t != T2(float('nan'), 'a')
+        assert t != None
+
+        @visual(['x', 'a%s'])
+        class T5:
+            def __init__(self, x):
+                self.__x = x
+                setattr(self, 'a%s', (1, 2))
+
+        assert repr(T5(1)) == '<T5 x: 1, a%s: (1, 2)>'
+
+        @hasheq(['x'])
+        @visual(['x'])
+        class T3:
+            def __init__(self, x):
+                self.__x = x
+
+            @property
+            def x(self):
+                raise AttributeError('x')
+
+        assert repr(T3(1)) == '<T3 x: 1>'
+        assert T3(1) == T3(1)
+        assert hash(T3(1)) == hash(1)
+
+        @hasheq(['x', 'y'])
+        class T4:
+            def __init__(self, x, y):
+                self.__x = x
+                self.__y = y
+
+            @property
+            def y(self):
+                raise KeyError('y')
+
+        assert T4(1, 2) != T4(2, 2)  # y is not read once x differs
+        with pytest.raises(KeyError):
+            _ = T4(1, 2) == T4(1, 2)
+
+    def test_auto_items(self):
+        @hasheq()
+        @visual()
+        class T:
+            __slots__ = ('__x', '__y')
+            __z = 3
+
+            def __init__(self, x, y):
+                self.__x = x
+                self.__y = y
+
+        t = T(1, 2)
+        assert repr(t) == '<T x: 1, y: 2, z: 3>'
+        assert t == T(1, 2)
+        assert t != T(1, 3)
+        assert hash(t) == hash((1, 2, 3))
+
+        @hasheq()
+        @visual()
+        class T1:
+            def __init__(self, x, y):
+                self.__y = y
+                self.__x = x
+                self.x_ = x
+
+        t = T1(1, 2)
+        assert repr(t) == '<T1 x: 1, y: 2>'
+        assert t == T1(1, 2)
+        assert hash(t) == hash((1, 2))
+
+    def test_auto_items_subclass(self):
+        @hasheq()
+        @visual()
+        @asitems(['x'])
+        class T:
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+        @asitems(['x', 'y'])
+        class T1(T):
+            pass
+
+        t = T(1, 2)
+        assert repr(t) == '<T x: 1>'
+        assert t == T(1, 3)
+        assert hash(t) == hash(1)
+
+        t = T1(1, 2)
+        assert repr(t) == '<T1 x: 1, y: 2>'
+        assert t == T1(1, 2)
+        assert t != T1(1, 3)
+        assert hash(t) == hash((1, 2))
+
+    def test_hasheq_frozen(self):
+        reads = []
+
+        @hasheq(['x', 'y'], frozen=True)
+        class T:
+            def __init__(self, x, y):
+                self.__x = x
+                self.__y = y
+
+            @property
+            def x(self):
+                reads.append(self.__x)
+                return self.__x
+
+        t = T(1, (2, 3))
+        assert hash(t) == hash((1, (2, 3)))
+        assert hash(t) == hash((1, (2, 3)))
+        assert reads == [1]
+        assert hash(T(1, (2, 3))) == hash(t)
+        assert t == T(1, (2, 3))
+        assert len(reads) == 4
+
+        assert t._hasheq_cached_hash == hash((1, (2, 3)))
+
+        @hasheq(['x'], frozen=True)
+        class T1:
+            __slots__ = ('_T1__x',)
+
+            def __init__(self, x):
+                self.__x = x
+
+        t1 = T1(1)
+        assert hash(t1) == hash(1)
+        assert hash(t1) == hash(1)  # no __dict__ or slot to cache the hash value
+        assert not hasattr(t1, '_hasheq_cached_hash')
+
+        @hasheq(frozen=True)
+        class T2:
+            def __init__(self, x):
+                self.__x = x
+
+        assert hash(T2(1)) == hash((1,))
 
     def test_accessor(self):
         @accessor()
@@ -181,6 +501,7 @@ class TestModelClazz:
         t.x, t.y = 3, 7
         assert t.x == 3
         assert t.y == 7
+        assert 'Both reading and writing are' in T1.x.__doc__
 
         @accessor(readonly=True)
         @asitems(['x', 'y'])
@@ -194,6 +515,7 @@ class TestModelClazz:
         assert t.y == 100
         with pytest.raises(AttributeError):
             t.x = 3
+        assert 'Only reading is' in T2.x.__doc__
         with pytest.raises(AttributeError):
             t.y = 7
 
@@ -1,6 +1,8 @@
+import operator
+
 import pytest
 
-from hbutils.model import IComparable
+from hbutils.model import IComparable, comparable_sort
 
 
 @pytest.mark.unittest
@@ -39,8 +41,35 @@ class TestModelCompare:
         assert v2 > v1
 
         assert v1 != 1
+        assert MyValue.__ne__ is object.__ne__
         assert not (v1 == 1)
         assert not (v1 > 1)
         assert not (v1 >= 1)
         assert not (v1 < 1)
         assert not (v1 <= 1)
+
+        assert v1._cmpcheck(operator.lt, v2)
+        assert not v1._cmpcheck(operator.lt, 1)
+        assert v1._cmpcheck(operator.lt, 1, default=True)
+
+    def test_comparable_sort(self):
+        class MyValue(IComparable):
+            def __init__(self, v, tag=None) -> None:
+                self.v = v
+                self.tag = tag
+
+            def _cmpkey(self):
+                return self.v
+
+        items = [MyValue(2, 'a'), MyValue(3), MyValue(1), MyValue(2, 'b')]
+        assert [(x.v, x.tag) for x in comparable_sort(items)] == [(1, None), (2, 'a'), (2, 'b'), (3, None)]
+        assert [(x.v, x.tag) for x in comparable_sort(iter(items), reverse=True)] == \
+               [(3, None), (2, 'a'), (2, 'b'), (1, None)]
+        assert [x.v for x in comparable_sort(items)] == [x.v for x in sorted(items)]
+        assert comparable_sort([]) == []
+
+        class OtherValue(MyValue):
+            pass
+
+        with pytest.raises(TypeError):
+            comparable_sort([MyValue(1), OtherValue(2)])
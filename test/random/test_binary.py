@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from hbutils.random import random_bytes
@@ -22,3 +24,20 @@ class TestRandomBinary:
             assert len(b1) == 32
             once = once or (b'\0' in b1)
         assert once, f'Zero should appear at least once.'
+
+    def test_random_bytes_rnd(self):
+        assert random_bytes(0) == b''
+        assert random_bytes(-1) == b''
+        assert random_bytes(0, allow_zero=True) == b''
+
+        assert random_bytes(64, rnd=random.Random(10)) == random_bytes(64, rnd=random.Random(10))
+        assert random_bytes(64, rnd=random.Random(10)) != random_bytes(64, rnd=random.Random(11))
+
+        b1 = random_bytes(100000, rnd=random.Random(10))
+        assert len(b1) == 100000
+        assert b'\0' not in b1
+        assert set(b1) == set(range(1, 0x100))
+
+        b2 = random_bytes(100000, allow_zero=True, rnd=random.Random(10))
+        assert len(b2) == 100000
+        assert set(b2) == set(range(0, 0x100))